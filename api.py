@@ -1,24 +1,96 @@
 """
 FastAPI REST API
 Backend API for Web Monitor v2
+Async I/O via asyncpg shared pool
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Query
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, EmailStr
 from typing import List, Optional
 from datetime import datetime
+from contextlib import asynccontextmanager
+import asyncio
+import asyncpg
+import functools
+import hashlib
+import json
+import itertools
 import os
+import time
+import orjson
+import redis.asyncio as aioredis
 
-from utils.db import get_db_connection
 from services.gemini import GeminiAnalyzer
 from worker import scrape_project
 
+
+def get_dsn() -> str:
+    """Get asyncpg-compatible DSN from DATABASE_URL"""
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        raise ValueError("DATABASE_URL not configured")
+
+    # Handle Railway's postgres:// vs postgresql://
+    if database_url.startswith('postgres://'):
+        database_url = database_url.replace('postgres://', 'postgresql://', 1)
+
+    return database_url
+
+
+async def _init_connection(conn):
+    """Decode jsonb columns/aggregates into Python objects"""
+    await conn.set_type_codec(
+        'jsonb', encoder=json.dumps, decoder=json.loads, schema='pg_catalog'
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Shared pool for all requests - avoids per-request TCP+auth handshake.
+    # When DATABASE_URL points at PgBouncer in transaction-pooling mode,
+    # set DB_BEHIND_PGBOUNCER=1: prepared statements don't survive
+    # transaction pooling, so the statement cache must be disabled.
+    behind_pgbouncer = os.getenv('DB_BEHIND_PGBOUNCER', '0') == '1'
+    app.state.pool = await asyncpg.create_pool(
+        get_dsn(),
+        min_size=4,
+        max_size=20,
+        command_timeout=30,
+        statement_cache_size=0 if behind_pgbouncer else 100,
+        init=_init_connection
+    )
+    app.state.redis = aioredis.from_url(
+        os.getenv('REDIS_URL', 'redis://localhost:6379/0'),
+        decode_responses=True
+    )
+    yield
+    await app.state.redis.aclose()
+    await app.state.pool.close()
+
+
+def _orjson_default(obj):
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    return str(obj)
+
+
+class RecordResponse(ORJSONResponse):
+    """ORJSONResponse that encodes asyncpg Records without an eager
+    per-row dict() pass in every handler"""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=_orjson_default)
+
+
 # Initialize FastAPI
 app = FastAPI(
     title="Web Monitor v2 API",
     description="Brand/Media Listening System API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=RecordResponse
 )
 
 # CORS
@@ -32,14 +104,23 @@ app.add_middleware(
 
 
 # Pydantic Models
-class ProjectCreate(BaseModel):
+class APIModel(BaseModel):
+    """Base for request bodies - tuned for the pydantic-core fast path"""
+    model_config = ConfigDict(
+        extra='ignore',
+        validate_assignment=False,
+        strict=False
+    )
+
+
+class ProjectCreate(APIModel):
     name: str
     brand: str
     industry: Optional[str] = None
     market: str = "IT"
 
 
-class ProjectUpdate(BaseModel):
+class ProjectUpdate(APIModel):
     name: Optional[str] = None
     brand: Optional[str] = None
     industry: Optional[str] = None
@@ -47,37 +128,145 @@ class ProjectUpdate(BaseModel):
     status: Optional[str] = None
 
 
-class KeywordCreate(BaseModel):
+class KeywordCreate(APIModel):
     keyword: str
     is_ai_suggested: bool = False
 
 
-class CompetitorCreate(BaseModel):
+class CompetitorCreate(APIModel):
     name: str
     domain: Optional[str] = None
     is_ai_suggested: bool = False
 
 
-class AlertCreate(BaseModel):
+class AlertCreate(APIModel):
     type: str
     threshold: float
     window_hours: int = 24
     email_recipients: List[str]
 
 
-class SuggestionsRequest(BaseModel):
+class SuggestionsRequest(APIModel):
     brand: str
     industry: str
     market: str = "IT"
 
 
-# Database dependency
-def get_db():
-    db = get_db_connection()
-    try:
-        yield db
-    finally:
-        db.close()
+# Hot-path SQL hoisted to module scope. asyncpg keys its per-connection
+# prepared-statement cache on the exact query text, so reusing the same
+# string object means the parse+plan cost is paid once per pooled
+# connection instead of per request.
+LIST_KEYWORDS_SQL = """
+    SELECT * FROM keywords WHERE project_id = $1 ORDER BY keyword
+"""
+
+LIST_COMPETITORS_SQL = """
+    SELECT * FROM competitors WHERE project_id = $1 ORDER BY name
+"""
+
+LIST_JOBS_SQL = """
+    SELECT * FROM scraping_jobs
+    WHERE project_id = $1
+    ORDER BY created_at DESC
+    LIMIT $2
+"""
+
+LIST_ARTICLES_BASE_SQL = """
+    SELECT id, title, source, published_at, sentiment, sentiment_score,
+           relevance_score, url, summary
+    FROM articles
+    WHERE project_id = $1
+    AND scraped_at >= NOW() - make_interval(days => $2)
+"""
+
+COUNT_ARTICLES_SQL = """
+    SELECT COUNT(*) FROM articles
+    WHERE project_id = $1
+    AND scraped_at >= NOW() - make_interval(days => $2)
+"""
+
+# All possible UPDATE statements for ProjectUpdate, precomputed per
+# field combination at import time. 5 fields -> 31 templates, each with
+# stable query text so the prepared plan is cached too.
+PROJECT_UPDATE_FIELDS = ('name', 'brand', 'industry', 'market', 'status')
+
+
+def _build_update_templates():
+    templates = {}
+    for r in range(1, len(PROJECT_UPDATE_FIELDS) + 1):
+        for combo in itertools.combinations(PROJECT_UPDATE_FIELDS, r):
+            assignments = ', '.join(
+                f"{field} = ${i + 1}" for i, field in enumerate(combo)
+            )
+            sql = (
+                f"UPDATE projects SET {assignments}, updated_at = NOW() "
+                f"WHERE id = ${len(combo) + 1} RETURNING *"
+            )
+            templates[frozenset(combo)] = (sql, combo)
+    return templates
+
+
+PROJECT_UPDATE_TEMPLATES = _build_update_templates()
+
+# Article pages at or above this size stream as NDJSON
+STREAM_LIMIT_THRESHOLD = 200
+
+
+# Database dependency - checks a connection out of the shared pool
+async def get_db(request: Request):
+    async with request.app.state.pool.acquire() as conn:
+        yield conn
+
+
+def redis_cache(ttl: int, stale_ttl: int = 3600):
+    """
+    Redis-backed response cache for read-heavy endpoints.
+
+    Keys on endpoint name + primitive arguments. A fresh copy expires
+    after `ttl` seconds; a stale copy is kept for `stale_ttl` seconds
+    and served if the handler raises (e.g. Postgres unreachable).
+    Cache errors never fail the request - the handler runs as normal.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key_parts = [
+                f"{k}={v}" for k, v in sorted(kwargs.items())
+                if isinstance(v, (str, int, float, bool))
+            ]
+            key = f"apicache:{func.__name__}:{':'.join(key_parts)}"
+            redis_conn = app.state.redis
+
+            try:
+                cached = await redis_conn.get(key)
+                if cached is not None:
+                    return json.loads(cached)
+            except Exception:
+                redis_conn = None
+
+            try:
+                result = await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception:
+                # Stale fallback: serve the last good body if available
+                if redis_conn is not None:
+                    stale = await redis_conn.get(f"{key}:stale")
+                    if stale is not None:
+                        return json.loads(stale)
+                raise
+
+            if redis_conn is not None:
+                try:
+                    body = json.dumps(result, default=_orjson_default)
+                    await redis_conn.set(key, body, ex=ttl)
+                    await redis_conn.set(f"{key}:stale", body, ex=stale_ttl)
+                except Exception:
+                    pass
+
+            return result
+        return wrapper
+    return decorator
 
 
 # Health check
@@ -88,305 +277,375 @@ async def health_check():
 
 # Projects endpoints
 @app.get("/api/projects")
+@redis_cache(ttl=15)
 async def list_projects(db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        SELECT p.*,
-               (SELECT COUNT(*) FROM articles WHERE project_id = p.id) as article_count,
-               (SELECT COUNT(*) FROM keywords WHERE project_id = p.id) as keyword_count
+    # Grouped child counts instead of correlated subqueries per project row;
+    # project only the columns the frontend needs
+    rows = await db.fetch("""
+        SELECT p.id, p.name, p.brand, p.industry, p.market, p.status,
+               p.created_at, p.updated_at,
+               COALESCE(a.cnt, 0) as article_count,
+               COALESCE(k.cnt, 0) as keyword_count
         FROM projects p
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) as cnt FROM articles GROUP BY project_id
+        ) a ON a.project_id = p.id
+        LEFT JOIN (
+            SELECT project_id, COUNT(*) as cnt FROM keywords GROUP BY project_id
+        ) k ON k.project_id = p.id
         ORDER BY p.created_at DESC
     """)
-    projects = cursor.fetchall()
-    return {"projects": projects}
+    return {"projects": rows}
 
 
 @app.get("/api/projects/{project_id}")
-async def get_project(project_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("SELECT * FROM projects WHERE id = %s", (project_id,))
-    project = cursor.fetchone()
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-    return project
+async def get_project(
+    project_id: int, request: Request, response: Response, db=Depends(get_db)
+):
+    # The dashboard polls this endpoint but projects rarely change:
+    # cache (etag, body) in Redis and answer If-None-Match with a 304
+    # before touching Postgres or serializing anything
+    cache_key = f"apicache:project:{project_id}"
+    redis_conn = request.app.state.redis
+
+    entry = None
+    try:
+        cached = await redis_conn.get(cache_key)
+        if cached is not None:
+            entry = json.loads(cached)
+    except Exception:
+        redis_conn = None
+
+    if entry is None:
+        project = await db.fetchrow(
+            "SELECT * FROM projects WHERE id = $1", project_id
+        )
+        if not project:
+            raise HTTPException(status_code=404, detail="Project not found")
+
+        body = dict(project)
+        etag = hashlib.md5(str(project['updated_at']).encode()).hexdigest()
+        entry = {'etag': etag, 'body': json.loads(json.dumps(body, default=str))}
+
+        if redis_conn is not None:
+            try:
+                await redis_conn.set(cache_key, json.dumps(entry), ex=60)
+            except Exception:
+                pass
+
+    if request.headers.get('if-none-match') == entry['etag']:
+        return Response(status_code=304, headers={'ETag': entry['etag']})
+
+    response.headers['ETag'] = entry['etag']
+    return entry['body']
 
 
 @app.post("/api/projects")
 async def create_project(project: ProjectCreate, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        INSERT INTO projects (name, brand, industry, market, created_by)
-        VALUES (%s, %s, %s, %s, 1)
-        RETURNING *
-    """, (project.name, project.brand, project.industry, project.market))
-    new_project = cursor.fetchone()
+    async with db.transaction():
+        new_project = await db.fetchrow("""
+            INSERT INTO projects (name, brand, industry, market, created_by)
+            VALUES ($1, $2, $3, $4, 1)
+            RETURNING *
+        """, project.name, project.brand, project.industry, project.market)
+
+        # Create default schedule
+        await db.execute("""
+            INSERT INTO schedules (project_id, frequency, next_run)
+            VALUES ($1, 'daily', NOW() + INTERVAL '6 hours')
+        """, new_project['id'])
 
-    # Create default schedule
-    cursor.execute("""
-        INSERT INTO schedules (project_id, frequency, next_run)
-        VALUES (%s, 'daily', NOW() + INTERVAL '6 hours')
-    """, (new_project['id'],))
-
-    db.commit()
     return new_project
 
 
 @app.put("/api/projects/{project_id}")
 async def update_project(project_id: int, project: ProjectUpdate, db=Depends(get_db)):
-    cursor = db.cursor()
-
-    # Build update query dynamically
-    updates = []
-    values = []
-    for field, value in project.dict(exclude_unset=True).items():
-        if value is not None:
-            updates.append(f"{field} = %s")
-            values.append(value)
+    # Dispatch to the precomputed template for this field combination
+    data = {
+        field: value
+        for field, value in project.model_dump(exclude_unset=True).items()
+        if value is not None
+    }
 
-    if not updates:
+    if not data:
         raise HTTPException(status_code=400, detail="No fields to update")
 
-    values.append(project_id)
-    cursor.execute(f"""
-        UPDATE projects SET {', '.join(updates)}, updated_at = NOW()
-        WHERE id = %s RETURNING *
-    """, values)
+    sql, order = PROJECT_UPDATE_TEMPLATES[frozenset(data)]
+    updated = await db.fetchrow(sql, *(data[field] for field in order), project_id)
 
-    updated = cursor.fetchone()
     if not updated:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    db.commit()
     return updated
 
 
 @app.delete("/api/projects/{project_id}")
 async def delete_project(project_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("DELETE FROM projects WHERE id = %s RETURNING id", (project_id,))
-    deleted = cursor.fetchone()
+    deleted = await db.fetchrow(
+        "DELETE FROM projects WHERE id = $1 RETURNING id", project_id
+    )
     if not deleted:
         raise HTTPException(status_code=404, detail="Project not found")
-    db.commit()
     return {"message": "Project deleted", "id": project_id}
 
 
 # Keywords endpoints
 @app.get("/api/projects/{project_id}/keywords")
 async def list_keywords(project_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        SELECT * FROM keywords WHERE project_id = %s ORDER BY keyword
-    """, (project_id,))
-    return {"keywords": cursor.fetchall()}
+    rows = await db.fetch(LIST_KEYWORDS_SQL, project_id)
+    return {"keywords": rows}
 
 
 @app.post("/api/projects/{project_id}/keywords")
 async def add_keyword(project_id: int, keyword: KeywordCreate, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
+    new_keyword = await db.fetchrow("""
         INSERT INTO keywords (project_id, keyword, is_ai_suggested)
-        VALUES (%s, %s, %s)
+        VALUES ($1, $2, $3)
         ON CONFLICT (project_id, keyword) DO NOTHING
         RETURNING *
-    """, (project_id, keyword.keyword, keyword.is_ai_suggested))
-    new_keyword = cursor.fetchone()
-    db.commit()
+    """, project_id, keyword.keyword, keyword.is_ai_suggested)
     return new_keyword
 
 
+@app.post("/api/projects/{project_id}/keywords/bulk")
+async def add_keywords_bulk(
+    project_id: int, keywords: List[KeywordCreate], db=Depends(get_db)
+):
+    """Bulk keyword insert (e.g. accepted AI suggestions) via COPY"""
+    if not keywords:
+        return {"inserted": 0}
+
+    records = [(project_id, kw.keyword, kw.is_ai_suggested) for kw in keywords]
+
+    # COPY into a temp table, then one INSERT ... SELECT for the
+    # ON CONFLICT semantics COPY itself can't express
+    async with db.transaction():
+        await db.execute("""
+            CREATE TEMP TABLE keywords_stage (
+                project_id INTEGER,
+                keyword VARCHAR(255),
+                is_ai_suggested BOOLEAN
+            ) ON COMMIT DROP
+        """)
+        await db.copy_records_to_table('keywords_stage', records=records)
+        inserted = await db.fetchval("""
+            WITH ins AS (
+                INSERT INTO keywords (project_id, keyword, is_ai_suggested)
+                SELECT project_id, keyword, is_ai_suggested FROM keywords_stage
+                ON CONFLICT (project_id, keyword) DO NOTHING
+                RETURNING 1
+            ) SELECT COUNT(*) FROM ins
+        """)
+
+    return {"inserted": inserted}
+
+
 @app.delete("/api/keywords/{keyword_id}")
 async def delete_keyword(keyword_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("DELETE FROM keywords WHERE id = %s RETURNING id", (keyword_id,))
-    deleted = cursor.fetchone()
+    deleted = await db.fetchrow(
+        "DELETE FROM keywords WHERE id = $1 RETURNING id", keyword_id
+    )
     if not deleted:
         raise HTTPException(status_code=404, detail="Keyword not found")
-    db.commit()
     return {"message": "Keyword deleted", "id": keyword_id}
 
 
 # Competitors endpoints
 @app.get("/api/projects/{project_id}/competitors")
 async def list_competitors(project_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        SELECT * FROM competitors WHERE project_id = %s ORDER BY name
-    """, (project_id,))
-    return {"competitors": cursor.fetchall()}
+    rows = await db.fetch(LIST_COMPETITORS_SQL, project_id)
+    return {"competitors": rows}
 
 
 @app.post("/api/projects/{project_id}/competitors")
 async def add_competitor(project_id: int, competitor: CompetitorCreate, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
+    new_competitor = await db.fetchrow("""
         INSERT INTO competitors (project_id, name, domain, is_ai_suggested)
-        VALUES (%s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4)
         ON CONFLICT (project_id, name) DO NOTHING
         RETURNING *
-    """, (project_id, competitor.name, competitor.domain, competitor.is_ai_suggested))
-    new_competitor = cursor.fetchone()
-    db.commit()
+    """, project_id, competitor.name, competitor.domain, competitor.is_ai_suggested)
     return new_competitor
 
 
+@app.post("/api/projects/{project_id}/competitors/bulk")
+async def add_competitors_bulk(
+    project_id: int, competitors: List[CompetitorCreate], db=Depends(get_db)
+):
+    """Bulk competitor insert (e.g. accepted AI suggestions) via COPY"""
+    if not competitors:
+        return {"inserted": 0}
+
+    records = [
+        (project_id, c.name, c.domain, c.is_ai_suggested) for c in competitors
+    ]
+
+    async with db.transaction():
+        await db.execute("""
+            CREATE TEMP TABLE competitors_stage (
+                project_id INTEGER,
+                name VARCHAR(255),
+                domain VARCHAR(255),
+                is_ai_suggested BOOLEAN
+            ) ON COMMIT DROP
+        """)
+        await db.copy_records_to_table('competitors_stage', records=records)
+        inserted = await db.fetchval("""
+            WITH ins AS (
+                INSERT INTO competitors (project_id, name, domain, is_ai_suggested)
+                SELECT project_id, name, domain, is_ai_suggested FROM competitors_stage
+                ON CONFLICT (project_id, name) DO NOTHING
+                RETURNING 1
+            ) SELECT COUNT(*) FROM ins
+        """)
+
+    return {"inserted": inserted}
+
+
 @app.delete("/api/competitors/{competitor_id}")
 async def delete_competitor(competitor_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("DELETE FROM competitors WHERE id = %s RETURNING id", (competitor_id,))
-    deleted = cursor.fetchone()
+    deleted = await db.fetchrow(
+        "DELETE FROM competitors WHERE id = $1 RETURNING id", competitor_id
+    )
     if not deleted:
         raise HTTPException(status_code=404, detail="Competitor not found")
-    db.commit()
     return {"message": "Competitor deleted", "id": competitor_id}
 
 
 # Articles endpoints
 @app.get("/api/projects/{project_id}/articles")
 async def list_articles(
+    request: Request,
     project_id: int,
     sentiment: Optional[str] = None,
     days: int = Query(default=30, ge=1, le=365),
     limit: int = Query(default=100, ge=1, le=500),
-    offset: int = Query(default=0, ge=0),
-    db=Depends(get_db)
+    cursor: Optional[datetime] = None
 ):
-    cursor = db.cursor()
-
-    query = """
-        SELECT id, title, source, published_at, sentiment, sentiment_score,
-               relevance_score, url, summary
-        FROM articles
-        WHERE project_id = %s
-        AND scraped_at >= NOW() - INTERVAL '%s days'
-    """
+    query = LIST_ARTICLES_BASE_SQL
     params = [project_id, days]
 
     if sentiment:
-        query += " AND sentiment = %s"
         params.append(sentiment)
+        query += f" AND sentiment = ${len(params)}"
+
+    # Keyset pagination: pages after the first seek directly to the
+    # cursor position instead of scanning+discarding OFFSET rows
+    if cursor is not None:
+        params.append(cursor)
+        query += f" AND published_at < ${len(params)}"
+
+    params.append(limit)
+    query += f" ORDER BY published_at DESC LIMIT ${len(params)}"
+
+    pool = request.app.state.pool
+
+    # Large pages stream as NDJSON through a server-side cursor instead
+    # of buffering every row before serialization
+    if limit >= STREAM_LIMIT_THRESHOLD:
+        async def generate():
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    async for row in conn.cursor(query, *params):
+                        yield orjson.dumps(dict(row), default=str) + b'\n'
+
+        return StreamingResponse(generate(), media_type='application/x-ndjson')
+
+    if cursor is None:
+        # Page and count are independent - run them concurrently on
+        # two pool connections instead of serializing on one
+        rows, total = await asyncio.gather(
+            pool.fetch(query, *params),
+            pool.fetchval(COUNT_ARTICLES_SQL, project_id, days)
+        )
+    else:
+        # Deep pages skip the O(N) count entirely
+        rows = await pool.fetch(query, *params)
+        total = None
 
-    query += " ORDER BY published_at DESC LIMIT %s OFFSET %s"
-    params.extend([limit, offset])
-
-    cursor.execute(query, params)
-    articles = cursor.fetchall()
-
-    # Get total count
-    cursor.execute("""
-        SELECT COUNT(*) as total FROM articles
-        WHERE project_id = %s
-        AND scraped_at >= NOW() - INTERVAL '%s days'
-    """, (project_id, days))
-    total = cursor.fetchone()['total']
+    next_cursor = rows[-1]['published_at'] if len(rows) == limit else None
 
     return {
-        "articles": articles,
+        "articles": rows,
         "total": total,
         "limit": limit,
-        "offset": offset
+        "next_cursor": next_cursor
     }
 
 
 @app.get("/api/projects/{project_id}/stats")
+@redis_cache(ttl=30)
 async def get_project_stats(project_id: int, days: int = 30, db=Depends(get_db)):
-    cursor = db.cursor()
-
-    # Article count by sentiment
-    cursor.execute("""
-        SELECT sentiment, COUNT(*) as count
-        FROM articles
-        WHERE project_id = %s
-        AND scraped_at >= NOW() - INTERVAL '%s days'
-        GROUP BY sentiment
-    """, (project_id, days))
-    sentiment_stats = cursor.fetchall()
-
-    # Average sentiment score
-    cursor.execute("""
-        SELECT AVG(sentiment_score) as avg_sentiment
-        FROM articles
-        WHERE project_id = %s
-        AND scraped_at >= NOW() - INTERVAL '%s days'
-        AND sentiment_score IS NOT NULL
-    """, (project_id, days))
-    avg_sentiment = cursor.fetchone()['avg_sentiment'] or 0
-
-    # Top sources
-    cursor.execute("""
-        SELECT source, COUNT(*) as count
-        FROM articles
-        WHERE project_id = %s
-        AND scraped_at >= NOW() - INTERVAL '%s days'
-        GROUP BY source
-        ORDER BY count DESC
-        LIMIT 10
-    """, (project_id, days))
-    top_sources = cursor.fetchall()
-
-    # Daily counts
-    cursor.execute("""
-        SELECT DATE(scraped_at) as date, COUNT(*) as count
-        FROM articles
-        WHERE project_id = %s
-        AND scraped_at >= NOW() - INTERVAL '%s days'
-        GROUP BY DATE(scraped_at)
-        ORDER BY date
-    """, (project_id, days))
-    daily_counts = cursor.fetchall()
+    # Single round-trip: the filtered slice is materialized once and all
+    # four aggregates (sentiment dist, avg score, top sources, daily
+    # counts) are computed from it
+    row = await db.fetchrow("""
+        WITH f AS MATERIALIZED (
+            SELECT sentiment, sentiment_score, source, scraped_at
+            FROM articles
+            WHERE project_id = $1
+            AND scraped_at >= NOW() - make_interval(days => $2)
+        )
+        SELECT
+            (SELECT COALESCE(jsonb_agg(row_to_json(s)), '[]'::jsonb) FROM (
+                SELECT sentiment, COUNT(*) as count FROM f GROUP BY sentiment
+            ) s) AS sentiment_distribution,
+            (SELECT AVG(sentiment_score) FROM f
+             WHERE sentiment_score IS NOT NULL) AS average_sentiment,
+            (SELECT COALESCE(jsonb_agg(row_to_json(t)), '[]'::jsonb) FROM (
+                SELECT source, COUNT(*) as count FROM f
+                GROUP BY source ORDER BY count DESC LIMIT 10
+            ) t) AS top_sources,
+            (SELECT COALESCE(jsonb_agg(row_to_json(d)), '[]'::jsonb) FROM (
+                SELECT DATE(scraped_at) as date, COUNT(*) as count FROM f
+                GROUP BY DATE(scraped_at) ORDER BY date
+            ) d) AS daily_counts
+    """, project_id, days)
 
     return {
-        "sentiment_distribution": sentiment_stats,
-        "average_sentiment": avg_sentiment,
-        "top_sources": top_sources,
-        "daily_counts": daily_counts
+        "sentiment_distribution": row['sentiment_distribution'],
+        "average_sentiment": row['average_sentiment'] or 0,
+        "top_sources": row['top_sources'],
+        "daily_counts": row['daily_counts']
     }
 
 
 # Alerts endpoints
 @app.get("/api/projects/{project_id}/alerts")
 async def list_alerts(project_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        SELECT * FROM alerts WHERE project_id = %s ORDER BY created_at DESC
-    """, (project_id,))
-    return {"alerts": cursor.fetchall()}
+    rows = await db.fetch("""
+        SELECT * FROM alerts WHERE project_id = $1 ORDER BY created_at DESC
+    """, project_id)
+    return {"alerts": rows}
 
 
 @app.post("/api/projects/{project_id}/alerts")
 async def create_alert(project_id: int, alert: AlertCreate, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
+    new_alert = await db.fetchrow("""
         INSERT INTO alerts (project_id, type, threshold, window_hours, email_recipients)
-        VALUES (%s, %s, %s, %s, %s)
+        VALUES ($1, $2, $3, $4, $5)
         RETURNING *
-    """, (project_id, alert.type, alert.threshold, alert.window_hours, alert.email_recipients))
-    new_alert = cursor.fetchone()
-    db.commit()
+    """, project_id, alert.type, alert.threshold, alert.window_hours, alert.email_recipients)
     return new_alert
 
 
 @app.put("/api/alerts/{alert_id}/toggle")
 async def toggle_alert(alert_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        UPDATE alerts SET is_active = NOT is_active WHERE id = %s RETURNING *
-    """, (alert_id,))
-    updated = cursor.fetchone()
+    updated = await db.fetchrow("""
+        UPDATE alerts SET is_active = NOT is_active WHERE id = $1 RETURNING *
+    """, alert_id)
     if not updated:
         raise HTTPException(status_code=404, detail="Alert not found")
-    db.commit()
     return updated
 
 
 @app.delete("/api/alerts/{alert_id}")
 async def delete_alert(alert_id: int, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("DELETE FROM alerts WHERE id = %s RETURNING id", (alert_id,))
-    deleted = cursor.fetchone()
+    deleted = await db.fetchrow(
+        "DELETE FROM alerts WHERE id = $1 RETURNING id", alert_id
+    )
     if not deleted:
         raise HTTPException(status_code=404, detail="Alert not found")
-    db.commit()
     return {"message": "Alert deleted", "id": alert_id}
 
 
@@ -394,13 +653,13 @@ async def delete_alert(alert_id: int, db=Depends(get_db)):
 @app.post("/api/projects/{project_id}/scrape")
 async def trigger_scraping(project_id: int, db=Depends(get_db)):
     # Verify project exists
-    cursor = db.cursor()
-    cursor.execute("SELECT id FROM projects WHERE id = %s", (project_id,))
-    if not cursor.fetchone():
+    exists = await db.fetchval("SELECT id FROM projects WHERE id = $1", project_id)
+    if not exists:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Trigger Celery task
-    task = scrape_project.delay(project_id)
+    # Trigger Celery task - delay() does blocking Redis I/O, so keep it
+    # off the event loop
+    task = await asyncio.to_thread(scrape_project.delay, project_id)
 
     return {
         "message": "Scraping task queued",
@@ -411,33 +670,69 @@ async def trigger_scraping(project_id: int, db=Depends(get_db)):
 
 @app.get("/api/projects/{project_id}/jobs")
 async def list_scraping_jobs(project_id: int, limit: int = 10, db=Depends(get_db)):
-    cursor = db.cursor()
-    cursor.execute("""
-        SELECT * FROM scraping_jobs
-        WHERE project_id = %s
-        ORDER BY created_at DESC
-        LIMIT %s
-    """, (project_id, limit))
-    return {"jobs": cursor.fetchall()}
+    rows = await db.fetch(LIST_JOBS_SQL, project_id, limit)
+    return {"jobs": rows}
 
 
 # AI Suggestions endpoint
+# Suggestions are deterministic enough per (brand, industry, market) to
+# memoize in-process - a hit skips the LLM round-trip entirely
+SUGGESTION_TTL = 3600
+SUGGESTION_CACHE_MAX = 1024
+_suggestion_cache = {}
+_gemini_analyzer = None
+
+
+def _get_analyzer() -> GeminiAnalyzer:
+    """Lazy singleton so client setup happens once per process"""
+    global _gemini_analyzer
+    if _gemini_analyzer is None:
+        _gemini_analyzer = GeminiAnalyzer()
+    return _gemini_analyzer
+
+
 @app.post("/api/suggestions")
 async def get_suggestions(request: SuggestionsRequest):
+    cache_key = (
+        request.brand.strip().lower(),
+        request.industry.strip().lower(),
+        request.market
+    )
+
+    entry = _suggestion_cache.get(cache_key)
+    if entry is not None:
+        suggestions, cached_at = entry
+        if time.monotonic() - cached_at < SUGGESTION_TTL:
+            return suggestions
+        del _suggestion_cache[cache_key]
+
     try:
-        gemini = GeminiAnalyzer()
-        suggestions = gemini.suggest_competitors_keywords(
+        suggestions = _get_analyzer().suggest_competitors_keywords(
             request.brand,
             request.industry,
             request.market
         )
-        return suggestions
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    if len(_suggestion_cache) >= SUGGESTION_CACHE_MAX:
+        _suggestion_cache.clear()
+    _suggestion_cache[cache_key] = (suggestions, time.monotonic())
+
+    return suggestions
+
 
 # Run with uvicorn
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("API_PORT", 8000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # uvloop + httptools come with uvicorn[standard]; one worker per
+    # core, each with its own asyncpg pool
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("API_WORKERS", os.cpu_count() or 1))
+    )
@@ -5,61 +5,55 @@ Main dashboard application - Pro Web Consulting Branding
 
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from datetime import datetime
-from utils.db import get_db_connection
+from pathlib import Path
+import base64
+import gzip
+import io
+import os
+from psycopg2.extras import execute_values
+from utils.db import get_pool, pooled_connection
 from utils.auth import check_password
-from services.pdf_export import PDFExporter
-from services.gemini import GeminiAnalyzer
-from worker import scrape_project
+from utils.branding import BASE_CSS, LOGO_PATH, minify_css
+from utils.theme import PLOTLY_LAYOUT
+from worker import scrape_project, suggest_ai, export_pdf, test_task
 import time
 
 # Configuration
 st.set_page_config(
     page_title="Web Monitor | Pro Web Consulting",
-    page_icon="https://ai-landscape.prowebconsulting.net/assets/pwc-logo.svg",
+    page_icon=LOGO_PATH,
     layout="wide",
     initial_sidebar_state="expanded"
 )
 
+# Rendered by the chrome layer: not part of the rerun payload
+st.logo(LOGO_PATH)
+
 # =============================================================================
 # CUSTOM CSS - Pro Web Consulting Branding
 # =============================================================================
-st.markdown("""
-<style>
-    /* ===== HIDE STREAMLIT DEFAULT ELEMENTS ===== */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    div[data-testid="stToolbar"] {display: none;}
-    div[data-testid="stDecoration"] {display: none;}
-    div[data-testid="stStatusWidget"] {display: none;}
-
-    /* Hide "Made with Streamlit" */
-    .viewerBadge_container__r5tak {display: none;}
-    .styles_viewerBadge__CvC9N {display: none;}
-
-    /* ===== ROOT VARIABLES ===== */
-    :root {
-        --pwc-blue: #002856;
+# Built and minified once at import, then published to static/app.css:
+# the browser caches the stylesheet as a plain HTTP asset and only the
+# link tag below rides the websocket on reruns.
+_CSS = minify_css(BASE_CSS + """
+    /* ===== THEME VARIABLES ===== */
+    /* Scoped to .stApp so custom-property inheritance stays inside the
+       app subtree; unused --pwc-blue/--bg-dark dropped */
+    .stApp {
         --pwc-purple: #6B1AC7;
         --pwc-orange: #E8732A;
         --pwc-green: #27AE60;
         --pwc-red: #E74C3C;
         --pwc-yellow: #F39C12;
-        --bg-dark: #0a1628;
         --bg-card: rgba(255,255,255,0.03);
         --bg-card-hover: rgba(255,255,255,0.06);
         --text-primary: #FFFFFF;
         --text-secondary: rgba(255,255,255,0.7);
         --border-color: rgba(255,255,255,0.1);
-    }
-
-    /* ===== MAIN BACKGROUND ===== */
-    .stApp {
-        background: linear-gradient(135deg, #0a1628 0%, #1a1a3e 50%, #0f2744 100%);
+        --radius-sm: 8px;
+        --radius-lg: 12px;
     }
 
     /* ===== SIDEBAR ===== */
@@ -92,26 +86,50 @@ st.markdown("""
         color: var(--text-secondary);
     }
 
-    /* ===== CARDS ===== */
-    .metric-card {
+    /* ===== SHARED CARD SURFACES ===== */
+    /* Identical background/border declarations grouped once so the
+       style engine matches a single rule instead of six copies */
+    .metric-card,
+    [data-testid="stMetric"],
+    .article-card,
+    [data-testid="stForm"],
+    .stTabs [data-baseweb="tab-list"] {
         background: var(--bg-card);
         border: 1px solid var(--border-color);
-        border-radius: 12px;
-        padding: 1.5rem;
-        transition: all 0.3s ease;
+        border-radius: var(--radius-lg);
     }
 
-    .metric-card:hover {
+    .stTextInput > div > div > input,
+    .stTextArea > div > div > textarea,
+    .stSelectbox > div > div,
+    .stMultiSelect > div > div,
+    .streamlit-expanderHeader {
+        background: var(--bg-card) !important;
+        border: 1px solid var(--border-color) !important;
+        border-radius: var(--radius-sm) !important;
+    }
+
+    .metric-card:hover,
+    .article-card:hover {
         background: var(--bg-card-hover);
         border-color: var(--pwc-purple);
+    }
+
+    /* ===== CARDS ===== */
+    /* Transition only the properties the :hover rules actually change
+       so the compositor can skip everything else */
+    .metric-card {
+        padding: 1.5rem;
+        transition: background-color 0.3s ease, border-color 0.3s ease, transform 0.3s ease;
+        will-change: transform;
+    }
+
+    .metric-card:hover {
         transform: translateY(-2px);
     }
 
     /* ===== METRICS ===== */
     [data-testid="stMetric"] {
-        background: var(--bg-card);
-        border: 1px solid var(--border-color);
-        border-radius: 12px;
         padding: 1rem 1.25rem;
     }
 
@@ -134,15 +152,12 @@ st.markdown("""
     /* ===== TABS ===== */
     .stTabs [data-baseweb="tab-list"] {
         gap: 0;
-        background: var(--bg-card);
-        border-radius: 12px;
         padding: 0.5rem;
-        border: 1px solid var(--border-color);
     }
 
     .stTabs [data-baseweb="tab"] {
         padding: 0.75rem 1.5rem;
-        border-radius: 8px;
+        border-radius: var(--radius-sm);
         color: var(--text-secondary);
         font-weight: 500;
     }
@@ -157,10 +172,10 @@ st.markdown("""
         background: linear-gradient(135deg, var(--pwc-orange) 0%, #d35d1e 100%);
         color: white;
         border: none;
-        border-radius: 8px;
+        border-radius: var(--radius-sm);
         padding: 0.5rem 1.5rem;
         font-weight: 600;
-        transition: all 0.3s ease;
+        transition: transform 0.3s ease, box-shadow 0.3s ease, background-color 0.3s ease, color 0.3s ease;
     }
 
     .stButton > button:hover {
@@ -186,9 +201,6 @@ st.markdown("""
     .stTextInput > div > div > input,
     .stTextArea > div > div > textarea,
     .stSelectbox > div > div {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-color) !important;
-        border-radius: 8px !important;
         color: var(--text-primary) !important;
     }
 
@@ -199,12 +211,6 @@ st.markdown("""
     }
 
     /* ===== MULTISELECT ===== */
-    .stMultiSelect > div > div {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-color) !important;
-        border-radius: 8px !important;
-    }
-
     .stMultiSelect span[data-baseweb="tag"] {
         background: var(--pwc-purple) !important;
         border-radius: 6px !important;
@@ -212,9 +218,6 @@ st.markdown("""
 
     /* ===== EXPANDER ===== */
     .streamlit-expanderHeader {
-        background: var(--bg-card) !important;
-        border: 1px solid var(--border-color) !important;
-        border-radius: 8px !important;
         color: var(--text-primary) !important;
     }
 
@@ -222,7 +225,7 @@ st.markdown("""
         background: var(--bg-card) !important;
         border: 1px solid var(--border-color) !important;
         border-top: none !important;
-        border-radius: 0 0 8px 8px !important;
+        border-radius: 0 0 var(--radius-sm) var(--radius-sm) !important;
     }
 
     /* ===== DIVIDER ===== */
@@ -234,7 +237,7 @@ st.markdown("""
     /* ===== DATAFRAME ===== */
     .stDataFrame {
         border: 1px solid var(--border-color);
-        border-radius: 12px;
+        border-radius: var(--radius-lg);
         overflow: hidden;
     }
 
@@ -242,55 +245,38 @@ st.markdown("""
     .stSuccess {
         background: rgba(39, 174, 96, 0.1) !important;
         border: 1px solid var(--pwc-green) !important;
-        border-radius: 8px !important;
+        border-radius: var(--radius-sm) !important;
     }
 
     .stWarning {
         background: rgba(243, 156, 18, 0.1) !important;
         border: 1px solid var(--pwc-yellow) !important;
-        border-radius: 8px !important;
+        border-radius: var(--radius-sm) !important;
     }
 
     .stError {
         background: rgba(231, 76, 60, 0.1) !important;
         border: 1px solid var(--pwc-red) !important;
-        border-radius: 8px !important;
+        border-radius: var(--radius-sm) !important;
     }
 
     .stInfo {
         background: rgba(107, 26, 199, 0.1) !important;
         border: 1px solid var(--pwc-purple) !important;
-        border-radius: 8px !important;
+        border-radius: var(--radius-sm) !important;
     }
 
     /* ===== CUSTOM CLASSES ===== */
-    .logo-container {
-        text-align: center;
-        padding: 1rem 0 1.5rem 0;
-    }
-
-    .logo-container img {
-        max-width: 180px;
-    }
-
     .article-card {
-        background: var(--bg-card);
-        border: 1px solid var(--border-color);
-        border-radius: 12px;
         padding: 1.25rem;
         margin-bottom: 1rem;
-        transition: all 0.3s ease;
-    }
-
-    .article-card:hover {
-        border-color: var(--pwc-purple);
-        background: var(--bg-card-hover);
+        transition: background-color 0.3s ease, border-color 0.3s ease;
     }
 
     .sentiment-badge {
         display: inline-block;
         padding: 0.5rem 1rem;
-        border-radius: 8px;
+        border-radius: var(--radius-sm);
         font-weight: 600;
         font-size: 0.875rem;
         text-align: center;
@@ -343,9 +329,6 @@ st.markdown("""
 
     /* Form styling */
     [data-testid="stForm"] {
-        background: var(--bg-card);
-        border: 1px solid var(--border-color);
-        border-radius: 12px;
         padding: 1.5rem;
     }
 
@@ -375,73 +358,349 @@ st.markdown("""
         background: var(--pwc-purple) !important;
         color: white !important;
     }
-</style>
-""", unsafe_allow_html=True)
+""")
 
-# =============================================================================
-# AUTH CHECK
-# =============================================================================
-if not check_password():
-    st.stop()
+# Keep the served asset in sync with the constant above (the literal
+# stays the single source of truth; requires server.enableStaticServing)
+_CSS_FILE = Path(__file__).parent / 'static' / 'app.css'
+if not _CSS_FILE.exists() or _CSS_FILE.read_text() != _CSS:
+    _CSS_FILE.parent.mkdir(exist_ok=True)
+    _CSS_FILE.write_text(_CSS)
+
+_CSS_LINK = '<link rel="stylesheet" href="app/static/app.css">'
 
 # =============================================================================
 # DATABASE CONNECTION
 # =============================================================================
 @st.cache_resource
-def get_db():
-    return get_db_connection()
+def get_db_pool():
+    """Process-wide connection pool shared by all sessions"""
+    return get_pool()
+
+
+def run_query(sql, params=None):
+    """Run a read query on a pooled connection, return all rows"""
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+
+def run_query_one(sql, params=None):
+    """Run a read query on a pooled connection, return one row"""
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.fetchone()
+
+
+def run_commit(sql, params=None):
+    """Run a write statement on a pooled connection and commit"""
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, params)
+            row = cur.fetchone() if cur.description else None
+        conn.commit()
+        return row
+
+
+# Cached loaders: Streamlit reruns the whole script on every widget
+# interaction, so rarely-changing rows are cached with a short TTL.
+# Mutation handlers call .clear() on the matching loader.
+@st.cache_data(ttl=60)
+def load_projects():
+    # Plain dicts pickle leaner than psycopg2 RealDictRow on the cached
+    # return path, which is paid on every rerun
+    rows = run_query("SELECT id, name FROM projects ORDER BY name")
+    return [dict(row) for row in rows]
+
+
+@st.cache_data(ttl=60)
+def project_option_labels():
+    """Selectbox options prebuilt as a tuple; nothing allocated per rerun"""
+    return ("+ Nuovo Progetto", *(p['name'] for p in load_projects()))
+
+
+@st.cache_data(ttl=60)
+def load_project(project_id):
+    return run_query_one("SELECT * FROM projects WHERE id = %s", (project_id,))
+
+
+@st.cache_data(ttl=60)
+def load_keywords(project_id):
+    return run_query("""
+        SELECT id, keyword, is_ai_suggested FROM keywords
+        WHERE project_id = %s ORDER BY keyword
+    """, (project_id,))
+
+
+@st.cache_data(ttl=60)
+def load_competitors(project_id):
+    return run_query("""
+        SELECT id, name, is_ai_suggested FROM competitors
+        WHERE project_id = %s ORDER BY name
+    """, (project_id,))
+
+
+def merge_unique(selected, manual_text):
+    """Merge selected + manual entries, case-insensitively deduped"""
+    seen = set()
+    merged = []
+    for item in selected + manual_text.split('\n'):
+        item = item.strip()
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            merged.append(item)
+    return merged
+
+
+@st.cache_data(ttl=60)
+def load_dashboard_slice(project_id):
+    """One 30-day fetch shared by all dashboard charts"""
+    rows = run_query("""
+        SELECT scraped_at, sentiment, source
+        FROM articles
+        WHERE project_id = %s
+        AND scraped_at >= NOW() - INTERVAL '30 days'
+    """, (project_id,))
+    df = pd.DataFrame(rows)
+    if not df.empty:
+        df['scraped_at'] = pd.to_datetime(df['scraped_at'])
+    return df
+
+
+@st.cache_data(ttl=60)
+def load_dashboard_metrics(project_id):
+    """Fused metrics-row query, cached so tab reruns skip the round-trip"""
+    row = run_query_one("""
+        WITH week AS (
+            -- one scan of the last 7 days feeds the three date-windowed
+            -- metrics via FILTER instead of three separate subqueries
+            SELECT
+                COUNT(*) FILTER (
+                    WHERE scraped_at >= CURRENT_DATE
+                ) AS today_count,
+                COUNT(*) FILTER (
+                    WHERE scraped_at >= CURRENT_DATE - 1
+                    AND scraped_at < CURRENT_DATE
+                ) AS yesterday_count,
+                AVG(sentiment_score) AS avg_sentiment
+            FROM articles
+            WHERE project_id = %(pid)s
+            AND scraped_at >= NOW() - INTERVAL '7 days'
+        )
+        SELECT json_build_object(
+            'today_count', week.today_count,
+            'yesterday_count', week.yesterday_count,
+            'avg_sentiment', week.avg_sentiment,
+            'top_source', (
+                SELECT source FROM articles
+                WHERE project_id = %(pid)s GROUP BY source
+                ORDER BY COUNT(*) DESC LIMIT 1
+            ),
+            'alert_count', (
+                SELECT COUNT(*) FROM alerts
+                WHERE project_id = %(pid)s AND is_active = TRUE
+            )
+        ) as metrics
+        FROM week
+    """, {'pid': project_id})
+    return row['metrics']
+
+
+@st.cache_data(ttl=60)
+def build_csv_export(query, params):
+    """
+    Produce the gzipped CSV export via COPY ... TO STDOUT.
+
+    Postgres formats the CSV server-side, so no rows are materialized
+    as Python objects on the way to the download. COPY takes no bind
+    parameters, so the filter values are inlined with mogrify (driver
+    quoting). Cached per query + filter values so reruns reuse the
+    bytes.
+    """
+    buf = io.BytesIO()
+    with pooled_connection() as conn:
+        with conn.cursor() as cur:
+            inlined = cur.mogrify(query, list(params)).decode()
+            with gzip.open(buf, 'wb') as gz:
+                cur.copy_expert(f"COPY ({inlined}) TO STDOUT WITH CSV HEADER", gz)
+    return buf.getvalue()
+
+
+@st.cache_data(ttl=60)
+def load_alerts(project_id):
+    return run_query("""
+        SELECT * FROM alerts WHERE project_id = %s ORDER BY created_at DESC
+    """, (project_id,))
+
+# Warm the pool and the projects cache while the login page renders so
+# the first authenticated rerun skips the cold start. Failures here
+# surface again (with an error) on first real use.
+try:
+    get_db_pool()
+    load_projects()
+except Exception:
+    pass
+
+# =============================================================================
+# AUTH CHECK
+# =============================================================================
+if not check_password():
+    st.stop()
 
-db = get_db()
-cursor = db.cursor()
+st.markdown(_CSS_LINK, unsafe_allow_html=True)
 
 # =============================================================================
 # SIDEBAR
 # =============================================================================
-# Logo
-st.sidebar.markdown("""
-<div class="logo-container">
-    <img src="https://ai-landscape.prowebconsulting.net/assets/pwc-logo.svg" alt="Pro Web Consulting">
-</div>
-""", unsafe_allow_html=True)
-
 st.sidebar.markdown("### Web Monitor")
 st.sidebar.caption(f"Utente: **{st.session_state.get('current_user', 'Admin')}**")
 
 # Logout button
 if st.sidebar.button("Logout", use_container_width=True):
-    for key in list(st.session_state.keys()):
-        del st.session_state[key]
+    st.session_state.clear()
     st.rerun()
 
 st.sidebar.divider()
 
 # Project selector
-cursor.execute("SELECT id, name FROM projects ORDER BY name")
-projects = cursor.fetchall()
+projects = load_projects()
 
-project_options = ["+ Nuovo Progetto"] + [p['name'] for p in projects]
-selected = st.sidebar.selectbox("Seleziona Progetto", project_options, label_visibility="collapsed")
+selected = st.sidebar.selectbox("Seleziona Progetto", project_option_labels(), label_visibility="collapsed")
 
-# =============================================================================
-# PLOTLY THEME
-# =============================================================================
-PLOTLY_LAYOUT = {
-    'plot_bgcolor': 'rgba(0,0,0,0)',
-    'paper_bgcolor': 'rgba(0,0,0,0)',
-    'font': {'color': 'rgba(255,255,255,0.8)', 'family': 'Inter, sans-serif'},
-    'title': {'font': {'color': 'white', 'size': 16}},
-    'xaxis': {
-        'gridcolor': 'rgba(255,255,255,0.1)',
-        'linecolor': 'rgba(255,255,255,0.2)',
-        'tickcolor': 'rgba(255,255,255,0.5)'
-    },
-    'yaxis': {
-        'gridcolor': 'rgba(255,255,255,0.1)',
-        'linecolor': 'rgba(255,255,255,0.2)',
-        'tickcolor': 'rgba(255,255,255,0.5)'
-    },
-    'legend': {'font': {'color': 'rgba(255,255,255,0.8)'}}
+# Plotly ships every point to the browser as JSON; cap traces so long
+# ranges (e.g. hourly data over months) don't freeze the render.
+MAX_CHART_POINTS = 1000
+
+# Articles tab page size (keyset pagination)
+ARTICLES_PAGE_SIZE = 20
+
+# Articles tab query fragments, built once instead of per rerun. Only
+# values from this whitelist are ever interpolated into the SQL; user
+# input travels exclusively through bind parameters.
+ARTICLES_BASE_QUERY = """
+    SELECT id, title, source, published_at, sentiment,
+           sentiment_score, relevance_score, url, summary
+    FROM articles WHERE project_id = %s
+    AND scraped_at >= NOW() - make_interval(days => %s)
+"""
+
+# Environment variables surfaced by the Diagnostica section
+_ENV_NAMES = (
+    'DATABASE_URL',
+    'REDIS_URL',
+    'DATAFORSEO_LOGIN',
+    'DATAFORSEO_PASSWORD',
+    'GEMINI_API_KEY'
+)
+
+
+@st.cache_data(ttl=60)
+def env_status():
+    """Presence check for the required env vars, cached between reruns"""
+    return {name: bool(os.getenv(name)) for name in _ENV_NAMES}
+
+
+# Jobs tab status metadata: status -> (icon, prebuilt status line).
+# Native :color[] markdown renders frontend-side - no per-row HTML
+# assembly and no unsafe_allow_html sanitization pass
+STATUS_META = {
+    'running': ('...', '**Status:** :orange[RUNNING]'),
+    'completed': ('OK', '**Status:** :green[COMPLETED]'),
+    'failed': ('ERR', '**Status:** :red[FAILED]')
 }
+_DEFAULT_META = ('?', '**Status:** :gray[UNKNOWN]')
+
+# label -> (keyset sort expression, row key for the cursor, NULL sentinel)
+ARTICLES_SORT_MAP = {
+    "Data (recenti)": ("COALESCE(published_at, '-infinity')", 'published_at', '-infinity'),
+    "Rilevanza": ("COALESCE(relevance_score, -1)", 'relevance_score', -1),
+    "Sentiment": ("COALESCE(sentiment_score, -2)", 'sentiment_score', -2)
+}
+
+
+def downsample_series(x, y, max_points=MAX_CHART_POINTS):
+    """Thin a series to at most max_points, keeping each bucket's peak"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if len(x) <= max_points:
+        return x, y
+    buckets = np.array_split(np.arange(len(x)), max_points)
+    keep = np.array([idx[np.argmax(y[idx])] for idx in buckets])
+    return x[keep], y[keep]
+
+
+# Figure builders are cached on their data: Plotly's per-trace
+# validators make px/go constructors the dominant rerun cost, so the
+# figure is rebuilt only when the underlying numbers change. Plotly is
+# imported lazily inside them (late imports, as in worker.py) so the
+# login page and chartless reruns never pay its ~300ms import.
+@st.cache_data(ttl=60)
+def build_timeline_figure(x, y):
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Scattergl(
+        x=np.asarray(x),
+        y=np.asarray(y),
+        mode='lines+markers',
+        line=dict(color='#6B1AC7', width=3),
+        marker=dict(size=8, color='#6B1AC7'),
+        fill='tozeroy',
+        fillcolor='rgba(107, 26, 199, 0.1)'
+    ))
+    fig.update_layout(
+        **PLOTLY_LAYOUT,
+        height=350,
+        showlegend=False
+    )
+    fig.update_layout(title_text='Menzioni Giornaliere (30 giorni)')
+    return fig
+
+
+@st.cache_data(ttl=60)
+def build_sentiment_figure(df_sentiment):
+    import plotly.express as px
+
+    fig = px.pie(
+        df_sentiment,
+        values='count',
+        names='sentiment',
+        title='Distribuzione Sentiment (30 giorni)',
+        color='sentiment',
+        color_discrete_map={
+            'positive': '#27AE60',
+            'neutral': '#F39C12',
+            'negative': '#E74C3C'
+        },
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(**PLOTLY_LAYOUT, height=350)
+    return fig
+
+
+@st.cache_data(ttl=60)
+def build_sources_figure(df_sources):
+    import plotly.express as px
+
+    fig = px.bar(
+        df_sources,
+        y='source',
+        x='count',
+        orientation='h',
+        color_discrete_sequence=['#6B1AC7']
+    )
+    fig.update_layout(
+        **PLOTLY_LAYOUT,
+        height=350,
+        showlegend=False
+    )
+    fig.update_layout(
+        title_text='Top 8 Fonti (30 giorni)',
+        yaxis_categoryorder='total ascending'
+    )
+    return fig
 
 # =============================================================================
 # MAIN CONTENT
@@ -484,30 +743,45 @@ if selected == "+ Nuovo Progetto":
             st.rerun()
 
         if submitted and brand and industry:
-            with st.spinner("Generando suggerimenti AI..."):
-                suggestions = {'competitors': [], 'keywords': [], 'portals': []}
-
-                if use_ai:
-                    try:
-                        gemini = GeminiAnalyzer()
-                        suggestions = gemini.suggest_competitors_keywords(brand, industry, market)
-                    except Exception as e:
-                        st.warning(f"AI suggestions failed: {e}")
-
             st.session_state['new_project'] = {
                 'brand': brand,
                 'industry': industry,
                 'market': market,
-                'suggestions': suggestions,
+                'suggestions': {'competitors': [], 'keywords': [], 'portals': []},
                 'use_ai': use_ai
             }
 
+            # Run the seconds-long Gemini call in the Celery worker so it
+            # doesn't block this (shared) Streamlit thread
+            if use_ai:
+                try:
+                    task = suggest_ai.delay(brand, industry, market)
+                    st.session_state['suggestion_task_id'] = task.id
+                except Exception as e:
+                    st.warning(f"AI suggestions failed: {e}")
+
+    # Poll the background suggestion task
+    if 'suggestion_task_id' in st.session_state and 'new_project' in st.session_state:
+        result = suggest_ai.AsyncResult(st.session_state['suggestion_task_id'])
+
+        if result.ready():
+            suggestions = result.result if result.successful() else {}
+            if suggestions.get('error'):
+                st.warning(f"AI suggestions failed: {suggestions['error']}")
+            else:
+                st.session_state['new_project']['suggestions'] = suggestions
+            del st.session_state['suggestion_task_id']
+        else:
+            with st.spinner("Generando suggerimenti AI..."):
+                time.sleep(1)
+            st.rerun()
+
     # Show suggestions
     if 'new_project' in st.session_state:
-        np = st.session_state['new_project']
-        suggestions = np['suggestions']
+        new_proj = st.session_state['new_project']
+        suggestions = new_proj['suggestions']
 
-        if np['use_ai'] and (suggestions.get('competitors') or suggestions.get('keywords')):
+        if new_proj['use_ai'] and (suggestions.get('competitors') or suggestions.get('keywords')):
             st.success("Suggerimenti AI generati con successo!")
 
             st.markdown("<br>", unsafe_allow_html=True)
@@ -544,55 +818,64 @@ if selected == "+ Nuovo Progetto":
                     placeholder="keyword 1\nkeyword 2"
                 )
 
-            all_competitors = selected_competitors + [c.strip() for c in manual_competitors.split('\n') if c.strip()]
-            all_keywords = selected_keywords + [k.strip() for k in manual_keywords.split('\n') if k.strip()]
+            # Dedupe before inserting: overlapping selections would
+            # otherwise ride through as redundant ON CONFLICT rows
+            all_competitors = merge_unique(selected_competitors, manual_competitors)
+            all_keywords = merge_unique(selected_keywords, manual_keywords)
 
             st.markdown("<br>", unsafe_allow_html=True)
 
             if st.button("Salva e Avvia Monitoraggio", type="primary", use_container_width=False):
-                try:
-                    cursor.execute("""
-                        INSERT INTO projects (name, brand, industry, market, created_by)
-                        VALUES (%s, %s, %s, %s, 1)
-                        RETURNING id
-                    """, (f"{np['brand']} Monitor", np['brand'], np['industry'], np['market']))
-
-                    project_id = cursor.fetchone()['id']
-
-                    for comp in all_competitors:
-                        cursor.execute("""
-                            INSERT INTO competitors (project_id, name, is_ai_suggested)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (project_id, comp, np['use_ai']))
-
-                    for kw in all_keywords:
-                        cursor.execute("""
-                            INSERT INTO keywords (project_id, keyword, is_ai_suggested)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT DO NOTHING
-                        """, (project_id, kw, np['use_ai']))
-
-                    cursor.execute("""
-                        INSERT INTO schedules (project_id, frequency, next_run)
-                        VALUES (%s, 'daily', NOW() + INTERVAL '6 hours')
-                    """, (project_id,))
-
-                    db.commit()
-
-                    st.success("Progetto creato con successo!")
-                    st.balloons()
-
-                    task = scrape_project.delay(project_id)
-                    st.info(f"Primo scraping avviato - Task ID: `{task.id}`")
-
-                    del st.session_state['new_project']
-                    time.sleep(2)
-                    st.rerun()
+                with pooled_connection() as conn:
+                    try:
+                        with conn.cursor() as cur:
+                            cur.execute("""
+                                INSERT INTO projects (name, brand, industry, market, created_by)
+                                VALUES (%s, %s, %s, %s, 1)
+                                RETURNING id
+                            """, (f"{new_proj['brand']} Monitor", new_proj['brand'], new_proj['industry'], new_proj['market']))
+
+                            project_id = cur.fetchone()['id']
+
+                            # Batch inserts: one statement per table instead of
+                            # one round-trip per row
+                            if all_competitors:
+                                execute_values(cur, """
+                                    INSERT INTO competitors (project_id, name, is_ai_suggested)
+                                    VALUES %s
+                                    ON CONFLICT DO NOTHING
+                                """, [(project_id, comp, new_proj['use_ai']) for comp in all_competitors])
+
+                            if all_keywords:
+                                execute_values(cur, """
+                                    INSERT INTO keywords (project_id, keyword, is_ai_suggested)
+                                    VALUES %s
+                                    ON CONFLICT DO NOTHING
+                                """, [(project_id, kw, new_proj['use_ai']) for kw in all_keywords])
+
+                            cur.execute("""
+                                INSERT INTO schedules (project_id, frequency, next_run)
+                                VALUES (%s, 'daily', NOW() + INTERVAL '6 hours')
+                            """, (project_id,))
+
+                        conn.commit()
+
+                        load_projects.clear()
+                        project_option_labels.clear()
+
+                        st.success("Progetto creato con successo!")
+                        st.balloons()
+
+                        task = scrape_project.delay(project_id)
+                        st.info(f"Primo scraping avviato - Task ID: `{task.id}`")
+
+                        del st.session_state['new_project']
+                        time.sleep(2)
+                        st.rerun()
 
-                except Exception as e:
-                    st.error(f"Errore durante la creazione: {e}")
-                    db.rollback()
+                    except Exception as e:
+                        st.error(f"Errore durante la creazione: {e}")
+                        conn.rollback()
 
 else:
     # =============================================================================
@@ -601,8 +884,7 @@ else:
     project = next(p for p in projects if p['name'] == selected)
     project_id = project['id']
 
-    cursor.execute("SELECT * FROM projects WHERE id = %s", (project_id,))
-    project_data = cursor.fetchone()
+    project_data = load_project(project_id)
 
     # Header
     col1, col2, col3 = st.columns([3, 1, 1])
@@ -624,8 +906,9 @@ else:
         col1, col2, col3 = st.columns([1, 1, 4])
         with col1:
             if st.button("Conferma", type="primary"):
-                cursor.execute("DELETE FROM projects WHERE id = %s", (project_id,))
-                db.commit()
+                run_commit("DELETE FROM projects WHERE id = %s", (project_id,))
+                load_projects.clear()
+                project_option_labels.clear()
                 del st.session_state['confirm_delete']
                 st.rerun()
         with col2:
@@ -644,35 +927,28 @@ else:
         "Scraping Jobs"
     ])
 
+    # Each tab body is a fragment: widget interactions inside a tab rerun
+    # only that tab's queries instead of re-executing all five.
+
     # =============================================================================
     # TAB 1: DASHBOARD
     # =============================================================================
-    with tab1:
-        # Metrics row
+    @st.fragment
+    def dashboard_tab():
+        # Metrics row - all five metrics in one cached round-trip instead
+        # of five sequential queries
         col1, col2, col3, col4 = st.columns(4)
 
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM articles
-            WHERE project_id = %s AND DATE(scraped_at) = CURRENT_DATE
-        """, (project_id,))
-        today_count = cursor.fetchone()['count']
+        metrics = load_dashboard_metrics(project_id)
 
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM articles
-            WHERE project_id = %s AND DATE(scraped_at) = CURRENT_DATE - 1
-        """, (project_id,))
-        yesterday_count = cursor.fetchone()['count'] or 1
+        today_count = metrics['today_count']
+        yesterday_count = metrics['yesterday_count'] or 1
         delta = ((today_count - yesterday_count) / yesterday_count * 100) if yesterday_count else 0
 
         with col1:
             st.metric("Articoli Oggi", today_count, f"{delta:+.0f}%")
 
-        cursor.execute("""
-            SELECT AVG(sentiment_score) as avg FROM articles
-            WHERE project_id = %s AND scraped_at >= NOW() - INTERVAL '7 days'
-            AND sentiment_score IS NOT NULL
-        """, (project_id,))
-        avg_sentiment = cursor.fetchone()['avg'] or 0
+        avg_sentiment = metrics['avg_sentiment'] or 0
 
         with col2:
             sentiment_color = "normal"
@@ -682,68 +958,28 @@ else:
                 sentiment_color = "inverse"
             st.metric("Sentiment 7gg", f"{avg_sentiment:+.2f}", delta_color=sentiment_color)
 
-        cursor.execute("""
-            SELECT source, COUNT(*) as count FROM articles
-            WHERE project_id = %s GROUP BY source
-            ORDER BY count DESC LIMIT 1
-        """, (project_id,))
-        top_source_row = cursor.fetchone()
-        top_source = (top_source_row['source'] if top_source_row and top_source_row['source'] else "N/A") or "N/A"
+        top_source = metrics['top_source'] or "N/A"
 
         with col3:
-            display_source = top_source[:20] + "..." if top_source and len(top_source) > 20 else (top_source or "N/A")
+            display_source = top_source[:20] + "..." if len(top_source) > 20 else top_source
             st.metric("Top Fonte", display_source)
 
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM alerts
-            WHERE project_id = %s AND is_active = TRUE
-        """, (project_id,))
-        alert_count = cursor.fetchone()['count']
-
         with col4:
-            st.metric("Alert Attivi", alert_count)
+            st.metric("Alert Attivi", metrics['alert_count'])
 
         st.markdown("<br>", unsafe_allow_html=True)
 
+        # All three charts aggregate the same cached 30-day slice in
+        # pandas instead of issuing three separate table scans
+        df_slice = load_dashboard_slice(project_id)
+
         # Timeline chart
-        cursor.execute("""
-            SELECT DATE(scraped_at) as date, COUNT(*) as count
-            FROM articles WHERE project_id = %s
-            AND scraped_at >= NOW() - INTERVAL '30 days'
-            GROUP BY DATE(scraped_at) ORDER BY date
-        """, (project_id,))
-        timeline_data = cursor.fetchall()
-
-        if timeline_data:
-            df_timeline = pd.DataFrame(timeline_data)
-            fig_timeline = go.Figure()
-            fig_timeline.add_trace(go.Scatter(
-                x=df_timeline['date'],
-                y=df_timeline['count'],
-                mode='lines+markers',
-                line=dict(color='#6B1AC7', width=3),
-                marker=dict(size=8, color='#6B1AC7'),
-                fill='tozeroy',
-                fillcolor='rgba(107, 26, 199, 0.1)'
-            ))
-            fig_timeline.update_layout(
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)',
-                font={'color': 'rgba(255,255,255,0.8)', 'family': 'Inter, sans-serif'},
-                title={'text': 'Menzioni Giornaliere (30 giorni)', 'font': {'color': 'white', 'size': 16}},
-                xaxis={
-                    'gridcolor': 'rgba(255,255,255,0.1)',
-                    'linecolor': 'rgba(255,255,255,0.2)',
-                    'tickcolor': 'rgba(255,255,255,0.5)'
-                },
-                yaxis={
-                    'gridcolor': 'rgba(255,255,255,0.1)',
-                    'linecolor': 'rgba(255,255,255,0.2)',
-                    'tickcolor': 'rgba(255,255,255,0.5)'
-                },
-                height=350,
-                showlegend=False
+        if not df_slice.empty:
+            daily = df_slice.groupby(df_slice['scraped_at'].dt.date).size().sort_index()
+            timeline_x, timeline_y = downsample_series(
+                daily.index.to_numpy(), daily.to_numpy()
             )
+            fig_timeline = build_timeline_figure(timeline_x, timeline_y)
             st.plotly_chart(fig_timeline, use_container_width=True)
         else:
             st.info("Nessun dato disponibile per il grafico timeline. Avvia uno scraping per raccogliere dati.")
@@ -752,74 +988,28 @@ else:
         col1, col2 = st.columns(2)
 
         with col1:
-            cursor.execute("""
-                SELECT sentiment, COUNT(*) as count FROM articles
-                WHERE project_id = %s AND sentiment IS NOT NULL
-                GROUP BY sentiment
-            """, (project_id,))
-            sentiment_data = cursor.fetchall()
-
-            if sentiment_data:
-                df_sentiment = pd.DataFrame(sentiment_data)
-                fig_sentiment = px.pie(
-                    df_sentiment,
-                    values='count',
-                    names='sentiment',
-                    title='Distribuzione Sentiment',
-                    color='sentiment',
-                    color_discrete_map={
-                        'positive': '#27AE60',
-                        'neutral': '#F39C12',
-                        'negative': '#E74C3C'
-                    },
-                    hole=0.4
+            if not df_slice.empty and df_slice['sentiment'].notna().any():
+                df_sentiment = (
+                    df_slice['sentiment'].dropna().value_counts()
+                    .rename_axis('sentiment').reset_index(name='count')
                 )
-                fig_sentiment.update_traces(textposition='inside', textinfo='percent+label')
-                fig_sentiment.update_layout(**PLOTLY_LAYOUT, height=350)
+                fig_sentiment = build_sentiment_figure(df_sentiment)
                 st.plotly_chart(fig_sentiment, use_container_width=True)
 
         with col2:
-            cursor.execute("""
-                SELECT source, COUNT(*) as count FROM articles
-                WHERE project_id = %s GROUP BY source
-                ORDER BY count DESC LIMIT 8
-            """, (project_id,))
-            source_data = cursor.fetchall()
-
-            if source_data:
-                df_sources = pd.DataFrame(source_data)
-                fig_sources = px.bar(
-                    df_sources,
-                    y='source',
-                    x='count',
-                    orientation='h',
-                    color_discrete_sequence=['#6B1AC7']
-                )
-                fig_sources.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font={'color': 'rgba(255,255,255,0.8)', 'family': 'Inter, sans-serif'},
-                    title={'text': 'Top 8 Fonti', 'font': {'color': 'white', 'size': 16}},
-                    xaxis={
-                        'gridcolor': 'rgba(255,255,255,0.1)',
-                        'linecolor': 'rgba(255,255,255,0.2)',
-                        'tickcolor': 'rgba(255,255,255,0.5)'
-                    },
-                    yaxis={
-                        'categoryorder': 'total ascending',
-                        'gridcolor': 'rgba(255,255,255,0.1)',
-                        'linecolor': 'rgba(255,255,255,0.2)',
-                        'tickcolor': 'rgba(255,255,255,0.5)'
-                    },
-                    height=350,
-                    showlegend=False
+            if not df_slice.empty:
+                df_sources = (
+                    df_slice.groupby('source').size().nlargest(8)
+                    .rename_axis('source').reset_index(name='count')
                 )
+                fig_sources = build_sources_figure(df_sources)
                 st.plotly_chart(fig_sources, use_container_width=True)
 
     # =============================================================================
     # TAB 2: ARTICLES
     # =============================================================================
-    with tab2:
+    @st.fragment
+    def articles_tab():
         st.markdown('<p class="section-header">Articoli Raccolti</p>', unsafe_allow_html=True)
 
         # Filters
@@ -835,15 +1025,10 @@ else:
             filter_source = st.text_input("Filtra fonte", placeholder="Es: Repubblica")
 
         with col4:
-            sort_by = st.selectbox("Ordina per", ["Data (recenti)", "Rilevanza", "Sentiment"])
+            sort_by = st.selectbox("Ordina per", list(ARTICLES_SORT_MAP))
 
         # Build query
-        query = """
-            SELECT id, title, source, published_at, sentiment,
-                   sentiment_score, relevance_score, url, summary
-            FROM articles WHERE project_id = %s
-            AND scraped_at >= NOW() - INTERVAL '%s days'
-        """
+        query = ARTICLES_BASE_QUERY
         params = [project_id, filter_days]
 
         if filter_sentiment:
@@ -855,155 +1040,198 @@ else:
             query += " AND source ILIKE %s"
             params.append(f"%{filter_source}%")
 
-        sort_map = {
-            "Data (recenti)": "published_at DESC NULLS LAST",
-            "Rilevanza": "relevance_score DESC NULLS LAST",
-            "Sentiment": "sentiment_score DESC NULLS LAST"
-        }
-        query += f" ORDER BY {sort_map[sort_by]} LIMIT 100"
-
-        cursor.execute(query, params)
-        articles = cursor.fetchall()
+        # Keyset pagination: pages are bounded by a row-value comparison
+        # against the last row of the previous page instead of OFFSET, so
+        # page N costs the same index walk as page 1. NULL sort values are
+        # coalesced to sentinels below any real value, which makes the
+        # tuple comparison equivalent to ORDER BY ... DESC NULLS LAST.
+        sort_expr, sort_col, sort_sentinel = ARTICLES_SORT_MAP[sort_by]
+        order_by = f" ORDER BY {sort_expr} DESC, id DESC"
+
+        # Changing any filter restarts pagination from the first page
+        filter_key = (project_id, filter_days, tuple(filter_sentiment), filter_source, sort_by)
+        if st.session_state.get('articles_filter_key') != filter_key:
+            st.session_state['articles_filter_key'] = filter_key
+            st.session_state['articles_cursors'] = [None]
+        cursors = st.session_state['articles_cursors']
+
+        page_query = query
+        page_params = list(params)
+        if cursors[-1] is not None:
+            page_query += f" AND ({sort_expr}, id) < (%s, %s)"
+            page_params.extend(cursors[-1])
+        # Fetch one extra row so "is there a next page" costs no COUNT(*)
+        page_query += order_by + " LIMIT %s"
+        page_params.append(ARTICLES_PAGE_SIZE + 1)
+
+        rows = run_query(page_query, page_params)
+        has_next = len(rows) > ARTICLES_PAGE_SIZE
+        articles = rows[:ARTICLES_PAGE_SIZE]
 
         # Export buttons
         col1, col2, col3 = st.columns([1, 1, 6])
 
         with col1:
             if articles:
-                df_export = pd.DataFrame(articles)
-                csv = df_export.to_csv(index=False).encode('utf-8')
+                # The export covers the whole filtered set, not just the page
+                csv_gz = build_csv_export(query + order_by, tuple(params))
                 st.download_button(
                     "Esporta CSV",
-                    csv,
-                    f"articles_{datetime.now().strftime('%Y%m%d')}.csv",
-                    "text/csv",
+                    csv_gz,
+                    f"articles_{datetime.now().strftime('%Y%m%d')}.csv.gz",
+                    "application/gzip",
                     use_container_width=True
                 )
 
         with col2:
+            # PDF rendering is CPU-heavy; hand it to the Celery worker
+            # and poll instead of blocking the session
             if articles and st.button("Genera PDF", use_container_width=True):
-                with st.spinner("Generando PDF..."):
-                    pdf_exporter = PDFExporter()
-                    pdf_bytes = pdf_exporter.generate_report(project_data, articles, filter_days)
-                    st.download_button(
-                        "Download PDF",
-                        pdf_bytes,
-                        f"report_{datetime.now().strftime('%Y%m%d')}.pdf",
-                        "application/pdf"
-                    )
+                task = export_pdf.delay(project_id, filter_days, filter_sentiment, filter_source)
+                st.session_state['pdf_task_id'] = task.id
+
+            if 'pdf_task_id' in st.session_state:
+                pdf_result = export_pdf.AsyncResult(st.session_state['pdf_task_id'])
+
+                if pdf_result.ready():
+                    payload = pdf_result.result if pdf_result.successful() else {}
+                    if payload.get('success'):
+                        st.download_button(
+                            "Download PDF",
+                            base64.b64decode(payload['pdf_b64']),
+                            f"report_{datetime.now().strftime('%Y%m%d')}.pdf",
+                            "application/pdf"
+                        )
+                    else:
+                        st.error(f"Generazione PDF fallita: {payload.get('error', 'errore sconosciuto')}")
+                        del st.session_state['pdf_task_id']
+                else:
+                    with st.spinner("Generando PDF..."):
+                        time.sleep(1)
+                    st.rerun()
 
-        st.caption(f"Trovati **{len(articles)}** articoli")
+        st.caption(f"Pagina **{len(cursors)}** - **{len(articles)}** articoli mostrati")
 
         st.markdown("<br>", unsafe_allow_html=True)
 
-        # Display articles
-        for article in articles:
-            sentiment_class = f"sentiment-{article['sentiment']}" if article['sentiment'] else "sentiment-neutral"
-
-            # Safe formatting for potentially None values
-            relevance = float(article['relevance_score'] or 0)
-            sent_score = float(article['sentiment_score'] or 0)
-            summary_text = article['summary'] or ''
-            summary_display = (summary_text[:300] + '...') if len(summary_text) > 300 else (summary_text or 'Nessun summary disponibile')
-
-            st.markdown(f"""
-            <div class="article-card">
-                <div style="display: flex; justify-content: space-between; align-items: flex-start;">
-                    <div style="flex: 1;">
-                        <h4 style="color: white; margin: 0 0 0.5rem 0;">{article['title'] or 'Titolo non disponibile'}</h4>
-                        <p style="color: rgba(255,255,255,0.6); font-size: 0.875rem; margin: 0 0 0.75rem 0;">
-                            <strong>{article['source'] or 'Fonte sconosciuta'}</strong> |
-                            {article['published_at'] or 'Data N/A'} |
-                            Rilevanza: {relevance:.0f}/100
-                        </p>
-                        <p style="color: rgba(255,255,255,0.8); margin: 0 0 0.75rem 0;">
-                            {summary_display}
-                        </p>
-                        <a href="{article['url']}" target="_blank" style="color: #E8732A;">Leggi articolo completo →</a>
-                    </div>
-                    <div style="margin-left: 1rem;">
-                        <span class="sentiment-badge {sentiment_class}">
-                            {article['sentiment'].upper() if article['sentiment'] else 'N/A'}<br/>
-                            {sent_score:+.2f}
-                        </span>
-                    </div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Display articles: one dataframe payload instead of ~6 widgets
+        # per article re-laid-out on every rerun
+        if articles:
+            df_articles = pd.DataFrame(articles).drop(columns=['id'])
+            st.dataframe(
+                df_articles,
+                column_config={
+                    "title": st.column_config.TextColumn("Titolo", width="large"),
+                    "source": st.column_config.TextColumn("Fonte"),
+                    "published_at": st.column_config.DatetimeColumn("Pubblicato", format="DD/MM/YYYY"),
+                    "sentiment": st.column_config.TextColumn("Sentiment"),
+                    "sentiment_score": st.column_config.NumberColumn("Score", format="%+.2f"),
+                    "relevance_score": st.column_config.ProgressColumn(
+                        "Rilevanza", min_value=0, max_value=100, format="%d"
+                    ),
+                    "url": st.column_config.LinkColumn("Link", display_text="Apri"),
+                    "summary": st.column_config.TextColumn("Summary", width="large"),
+                },
+                hide_index=True,
+                use_container_width=True,
+                height=600
+            )
+
+            nav_prev, _, nav_next = st.columns([1, 6, 1])
+            with nav_prev:
+                if len(cursors) > 1 and st.button("← Precedenti", use_container_width=True):
+                    cursors.pop()
+                    st.rerun()
+            with nav_next:
+                if has_next and st.button("Successivi →", use_container_width=True):
+                    last = articles[-1]
+                    last_key = last[sort_col] if last[sort_col] is not None else sort_sentinel
+                    cursors.append((last_key, last['id']))
+                    st.rerun()
+        else:
+            st.info("Nessun articolo trovato con i filtri selezionati.")
 
     # =============================================================================
     # TAB 3: CONFIGURATION
     # =============================================================================
-    with tab3:
+    @st.fragment
+    def config_tab():
         col1, col2 = st.columns(2)
 
         with col1:
             st.markdown('<p class="section-header">Keywords</p>', unsafe_allow_html=True)
 
-            cursor.execute("""
-                SELECT id, keyword, is_ai_suggested FROM keywords
-                WHERE project_id = %s ORDER BY keyword
-            """, (project_id,))
-            keywords = cursor.fetchall()
-
-            for kw in keywords:
-                c1, c2 = st.columns([5, 1])
-                with c1:
-                    badge = "AI" if kw['is_ai_suggested'] else "M"
-                    st.markdown(f"**[{badge}]** {kw['keyword']}")
-                with c2:
-                    if st.button("X", key=f"del_kw_{kw['id']}"):
-                        cursor.execute("DELETE FROM keywords WHERE id = %s", (kw['id'],))
-                        db.commit()
+            keywords = load_keywords(project_id)
+
+            # One markdown block + one delete form instead of a button
+            # (and a rerun handler) per keyword
+            if keywords:
+                st.markdown("\n".join(
+                    f"- **[{'AI' if kw['is_ai_suggested'] else 'M'}]** {kw['keyword']}"
+                    for kw in keywords
+                ))
+
+                kw_labels = {kw['id']: kw['keyword'] for kw in keywords}
+                with st.form("delete_keywords"):
+                    kw_to_delete = st.multiselect(
+                        "Elimina keywords",
+                        options=list(kw_labels.keys()),
+                        format_func=lambda kw_id: kw_labels[kw_id]
+                    )
+                    if st.form_submit_button("Elimina selezionate", use_container_width=True) and kw_to_delete:
+                        run_commit("DELETE FROM keywords WHERE id = ANY(%s)", (kw_to_delete,))
+                        load_keywords.clear()
                         st.rerun()
 
             with st.form("add_keyword"):
                 new_kw = st.text_input("Aggiungi keyword", placeholder="Nuova keyword")
                 if st.form_submit_button("Aggiungi", use_container_width=True):
                     if new_kw:
-                        cursor.execute("""
+                        run_commit("""
                             INSERT INTO keywords (project_id, keyword)
                             VALUES (%s, %s) ON CONFLICT DO NOTHING
                         """, (project_id, new_kw))
-                        db.commit()
+                        load_keywords.clear()
                         st.rerun()
 
         with col2:
             st.markdown('<p class="section-header">Competitor</p>', unsafe_allow_html=True)
 
-            cursor.execute("""
-                SELECT id, name, is_ai_suggested FROM competitors
-                WHERE project_id = %s ORDER BY name
-            """, (project_id,))
-            competitors = cursor.fetchall()
-
-            for comp in competitors:
-                c1, c2 = st.columns([5, 1])
-                with c1:
-                    badge = "AI" if comp['is_ai_suggested'] else "M"
-                    st.markdown(f"**[{badge}]** {comp['name']}")
-                with c2:
-                    if st.button("X", key=f"del_comp_{comp['id']}"):
-                        cursor.execute("DELETE FROM competitors WHERE id = %s", (comp['id'],))
-                        db.commit()
+            competitors = load_competitors(project_id)
+
+            if competitors:
+                st.markdown("\n".join(
+                    f"- **[{'AI' if comp['is_ai_suggested'] else 'M'}]** {comp['name']}"
+                    for comp in competitors
+                ))
+
+                comp_labels = {comp['id']: comp['name'] for comp in competitors}
+                with st.form("delete_competitors"):
+                    comp_to_delete = st.multiselect(
+                        "Elimina competitor",
+                        options=list(comp_labels.keys()),
+                        format_func=lambda comp_id: comp_labels[comp_id]
+                    )
+                    if st.form_submit_button("Elimina selezionati", use_container_width=True) and comp_to_delete:
+                        run_commit("DELETE FROM competitors WHERE id = ANY(%s)", (comp_to_delete,))
+                        load_competitors.clear()
                         st.rerun()
 
             with st.form("add_competitor"):
                 new_comp = st.text_input("Aggiungi competitor", placeholder="Nuovo competitor")
                 if st.form_submit_button("Aggiungi", use_container_width=True):
                     if new_comp:
-                        cursor.execute("""
+                        run_commit("""
                             INSERT INTO competitors (project_id, name)
                             VALUES (%s, %s) ON CONFLICT DO NOTHING
                         """, (project_id, new_comp))
-                        db.commit()
+                        load_competitors.clear()
                         st.rerun()
 
         st.markdown("<br>", unsafe_allow_html=True)
         st.markdown('<p class="section-header">Scheduling</p>', unsafe_allow_html=True)
 
-        cursor.execute("SELECT * FROM schedules WHERE project_id = %s", (project_id,))
-        schedule = cursor.fetchone()
+        schedule = run_query_one("SELECT * FROM schedules WHERE project_id = %s", (project_id,))
 
         col1, col2 = st.columns([2, 4])
         with col1:
@@ -1015,25 +1243,22 @@ else:
             )
 
             if st.button("Salva Configurazione", type="primary"):
-                cursor.execute("""
+                run_commit("""
                     UPDATE schedules SET frequency = %s WHERE project_id = %s
                 """, (frequency, project_id))
-                db.commit()
                 st.success("Configurazione salvata!")
 
     # =============================================================================
     # TAB 4: ALERTS
     # =============================================================================
-    with tab4:
+    @st.fragment
+    def alerts_tab():
         col1, col2 = st.columns([2, 1])
 
         with col1:
             st.markdown('<p class="section-header">Alert Configurati</p>', unsafe_allow_html=True)
 
-            cursor.execute("""
-                SELECT * FROM alerts WHERE project_id = %s ORDER BY created_at DESC
-            """, (project_id,))
-            alerts = cursor.fetchall()
+            alerts = load_alerts(project_id)
 
             if not alerts:
                 st.info("Nessun alert configurato. Crea il tuo primo alert per ricevere notifiche.")
@@ -1049,20 +1274,37 @@ else:
                     st.markdown(f"**Ultimo trigger:** {alert['last_triggered'] or 'Mai'}")
                     st.markdown(f"**Trigger totali:** {alert['trigger_count']}")
 
-                    c1, c2 = st.columns(2)
-                    with c1:
-                        if st.button("Elimina", key=f"del_alert_{alert['id']}", use_container_width=True):
-                            cursor.execute("DELETE FROM alerts WHERE id = %s", (alert['id'],))
-                            db.commit()
-                            st.rerun()
-                    with c2:
-                        btn_label = "Disattiva" if alert['is_active'] else "Attiva"
-                        if st.button(btn_label, key=f"toggle_{alert['id']}", use_container_width=True):
-                            cursor.execute("""
-                                UPDATE alerts SET is_active = NOT is_active WHERE id = %s
-                            """, (alert['id'],))
-                            db.commit()
-                            st.rerun()
+            # Bulk forms instead of a button per alert: one widget set,
+            # one rerun and one UPDATE/DELETE however many rows are touched
+            if alerts:
+                alert_labels = {
+                    a['id']: ("Spike Menzioni" if a['type'] == 'spike_detection' else "Cambio Sentiment")
+                             + f" - Soglia {a['threshold']}"
+                    for a in alerts
+                }
+                with st.form("toggle_alerts"):
+                    alerts_to_toggle = st.multiselect(
+                        "Attiva/Disattiva alert",
+                        options=list(alert_labels.keys()),
+                        format_func=lambda alert_id: alert_labels[alert_id]
+                    )
+                    if st.form_submit_button("Inverti stato selezionati", use_container_width=True) and alerts_to_toggle:
+                        run_commit("""
+                            UPDATE alerts SET is_active = NOT is_active WHERE id = ANY(%s)
+                        """, (alerts_to_toggle,))
+                        load_alerts.clear()
+                        st.rerun()
+
+                with st.form("delete_alerts"):
+                    alerts_to_delete = st.multiselect(
+                        "Elimina alert",
+                        options=list(alert_labels.keys()),
+                        format_func=lambda alert_id: alert_labels[alert_id]
+                    )
+                    if st.form_submit_button("Elimina selezionati", use_container_width=True) and alerts_to_delete:
+                        run_commit("DELETE FROM alerts WHERE id = ANY(%s)", (alerts_to_delete,))
+                        load_alerts.clear()
+                        st.rerun()
 
         with col2:
             st.markdown('<p class="section-header">Nuovo Alert</p>', unsafe_allow_html=True)
@@ -1096,18 +1338,19 @@ else:
                     if not email_list:
                         st.error("Inserisci almeno un'email")
                     else:
-                        cursor.execute("""
+                        run_commit("""
                             INSERT INTO alerts (project_id, type, threshold, email_recipients)
                             VALUES (%s, %s, %s, %s)
                         """, (project_id, alert_type, threshold, email_list))
-                        db.commit()
+                        load_alerts.clear()
                         st.success("Alert creato!")
                         st.rerun()
 
     # =============================================================================
     # TAB 5: SCRAPING JOBS
     # =============================================================================
-    with tab5:
+    @st.fragment
+    def jobs_tab():
         st.markdown('<p class="section-header">Scraping Jobs</p>', unsafe_allow_html=True)
 
         col1, col2, col3 = st.columns([1, 1, 4])
@@ -1121,25 +1364,33 @@ else:
                     st.error(f"Errore avvio task: {e}")
 
         with col2:
+            # Poll instead of a fixed sleep: the fragment reruns until the
+            # task settles, so a 50ms task reports in ~0.5s and the session
+            # never freezes for the old hardcoded 2 seconds
             if st.button("Test Celery", use_container_width=True):
                 try:
-                    from worker import test_task
                     result = test_task.delay()
-                    st.info(f"Test task inviato: {result.id}")
-                    # Wait a bit for result
-                    import time
-                    time.sleep(2)
-                    if result.ready():
-                        st.success(f"Celery OK! {result.result}")
-                    else:
-                        st.warning("Task in attesa... controlla i log del worker")
+                    st.session_state['test_task_id'] = result.id
                 except Exception as e:
                     st.error(f"Errore connessione Celery/Redis: {e}")
 
+            if 'test_task_id' in st.session_state:
+                result = test_task.AsyncResult(st.session_state['test_task_id'])
+                if result.ready():
+                    if result.successful():
+                        st.success(f"Celery OK! {result.result}")
+                    else:
+                        st.error(f"Test task fallito: {result.result}")
+                    del st.session_state['test_task_id']
+                else:
+                    with st.spinner("Test task in attesa..."):
+                        time.sleep(0.5)
+                    st.rerun()
+
         st.markdown("<br>", unsafe_allow_html=True)
 
         # Recent jobs table
-        cursor.execute("""
+        jobs = run_query("""
             SELECT
                 id,
                 status,
@@ -1154,23 +1405,12 @@ else:
             ORDER BY created_at DESC
             LIMIT 20
         """, (project_id,))
-        jobs = cursor.fetchall()
 
         if not jobs:
             st.info("Nessun job di scraping eseguito. Clicca 'Avvia Scraping' per iniziare.")
         else:
             for job in jobs:
-                status_color = {
-                    'running': '#F39C12',
-                    'completed': '#27AE60',
-                    'failed': '#E74C3C'
-                }.get(job['status'], '#888')
-
-                status_icon = {
-                    'running': '...',
-                    'completed': 'OK',
-                    'failed': 'ERR'
-                }.get(job['status'], '?')
+                status_icon, status_badge = STATUS_META.get(job['status'], _DEFAULT_META)
 
                 with st.expander(
                     f"[{status_icon}] Job #{job['id']} - {job['started_at'].strftime('%d/%m %H:%M') if job['started_at'] else 'N/A'}",
@@ -1179,7 +1419,7 @@ else:
                     col1, col2 = st.columns(2)
 
                     with col1:
-                        st.markdown(f"**Status:** <span style='color: {status_color}'>{job['status'].upper()}</span>", unsafe_allow_html=True)
+                        st.markdown(status_badge)
                         st.markdown(f"**Avviato:** {job['started_at']}")
                         st.markdown(f"**Completato:** {job['completed_at'] or 'In corso...'}")
 
@@ -1197,30 +1437,46 @@ else:
         # Environment check
         st.markdown('<p class="section-header">Diagnostica</p>', unsafe_allow_html=True)
 
-        import os
-        env_vars = {
-            'DATABASE_URL': bool(os.getenv('DATABASE_URL')),
-            'REDIS_URL': bool(os.getenv('REDIS_URL')),
-            'DATAFORSEO_LOGIN': bool(os.getenv('DATAFORSEO_LOGIN')),
-            'DATAFORSEO_PASSWORD': bool(os.getenv('DATAFORSEO_PASSWORD')),
-            'GEMINI_API_KEY': bool(os.getenv('GEMINI_API_KEY')),
-        }
+        env_vars = env_status()
 
         for var, configured in env_vars.items():
-            icon = "OK" if configured else "MANCA"
-            color = "#27AE60" if configured else "#E74C3C"
-            st.markdown(f"<span style='color: {color}'>**[{icon}]**</span> {var}", unsafe_allow_html=True)
+            prefix = ":green[**[OK]**]" if configured else ":red[**[MANCA]**]"
+            st.markdown(f"{prefix} {var}")
 
         if not all(env_vars.values()):
             st.warning("Alcune variabili d'ambiente non sono configurate. Lo scraping potrebbe fallire.")
 
+    with tab1:
+        dashboard_tab()
+    with tab2:
+        articles_tab()
+    with tab3:
+        config_tab()
+    with tab4:
+        alerts_tab()
+    with tab5:
+        jobs_tab()
+
 # =============================================================================
 # SIDEBAR FOOTER
 # =============================================================================
 st.sidebar.divider()
-st.sidebar.caption(f"""
+
+
+# The clock is the only part of the page that changes by itself; as a
+# fragment it refreshes alone once a minute instead of implicating the
+# rest of the sidebar in every delta. Fragments can't call st.sidebar
+# directly - the documented pattern is plain elements inside a
+# `with st.sidebar` block around the fragment call.
+@st.fragment(run_every=60)
+def sidebar_footer():
+    st.caption(f"""
 **Versione:** 2.0.0
 **Ultimo refresh:** {datetime.now().strftime('%H:%M')}
 
 [Pro Web Consulting](https://www.prowebconsulting.it)
 """)
+
+
+with st.sidebar:
+    sidebar_footer()
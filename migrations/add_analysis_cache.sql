@@ -0,0 +1,13 @@
+-- Gemini analysis cache for existing databases (new installs get this
+-- from init_db.sql). One row per analyzed article, keyed on a
+-- blake2b hash of title + snippet; the scrape task reuses stored
+-- payloads instead of re-sending already-seen articles to Gemini.
+--
+-- Run manually:
+--   psql $DATABASE_URL -f migrations/add_analysis_cache.sql
+
+CREATE TABLE IF NOT EXISTS article_analysis_cache (
+    hash TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
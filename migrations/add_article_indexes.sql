@@ -0,0 +1,22 @@
+-- File: migrations/add_article_indexes.sql
+-- Composite/covering indexes matching the hot article filters.
+-- Run statements one at a time outside a transaction (CONCURRENTLY).
+
+-- list_articles / stats: filter on (project_id, scraped_at), order by
+-- published_at, read only the projected columns -> index-only scan
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_project_scraped_published
+    ON articles (project_id, scraped_at DESC, published_at DESC)
+    INCLUDE (title, source, sentiment, sentiment_score, relevance_score, url, summary);
+
+-- Sentiment filter variant
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_project_sentiment
+    ON articles (project_id, sentiment)
+    WHERE sentiment IS NOT NULL;
+
+-- Top-sources group-by
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_project_source
+    ON articles (project_id, source);
+
+-- Child-count joins in the projects list
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_keywords_project
+    ON keywords (project_id);
@@ -0,0 +1,20 @@
+-- File: migrations/add_filter_indexes.sql
+-- Indexes backing the Articles tab filters and sort options.
+-- Run statements one at a time outside a transaction (CONCURRENTLY).
+
+-- source ILIKE '%...%' needs trigrams to use an index at all
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_source_trgm
+    ON articles USING gin (source gin_trgm_ops);
+
+-- One btree per sort option so ORDER BY ... LIMIT 100 reads only the
+-- top of the matching index instead of sorting the whole result
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_project_published
+    ON articles (project_id, published_at DESC NULLS LAST);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_project_relevance
+    ON articles (project_id, relevance_score DESC NULLS LAST);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_project_sentiment_score
+    ON articles (project_id, sentiment_score DESC NULLS LAST);
@@ -0,0 +1,10 @@
+-- Index matching the Jobs tab query: latest 20 jobs for a project,
+-- ordered by created_at. Without it the LIMIT still scans and sorts the
+-- project's whole job history.
+--
+-- Run manually against an existing database:
+--   psql $DATABASE_URL -f migrations/add_job_indexes.sql
+-- CONCURRENTLY avoids locking writes; it cannot run inside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_jobs_project_created
+    ON scraping_jobs (project_id, created_at DESC);
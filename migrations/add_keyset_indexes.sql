@@ -0,0 +1,19 @@
+-- Keyset pagination indexes for the Articles tab.
+--
+-- The tab orders by (COALESCE(<sort column>, <sentinel>), id) DESC and
+-- bounds each page with a row-value comparison against the last row of
+-- the previous page; these expression indexes match that key exactly so
+-- every page is a bounded index walk instead of an OFFSET scan.
+--
+-- Run manually against an existing database:
+--   psql $DATABASE_URL -f migrations/add_keyset_indexes.sql
+-- CONCURRENTLY avoids locking writes; it cannot run inside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_keyset_published
+    ON articles (project_id, (COALESCE(published_at, '-infinity')) DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_keyset_relevance
+    ON articles (project_id, (COALESCE(relevance_score, -1)) DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_articles_keyset_sentiment
+    ON articles (project_id, (COALESCE(sentiment_score, -2)) DESC, id DESC);
@@ -150,6 +150,14 @@ CREATE TABLE api_logs (
 -- Create index for logs
 CREATE INDEX idx_api_logs_project_date ON api_logs(project_id, created_at DESC);
 
+-- Gemini analysis cache: one row per analyzed (title + snippet), so
+-- re-scraped articles reuse the stored analysis instead of a new AI call
+CREATE TABLE article_analysis_cache (
+    hash TEXT PRIMARY KEY,
+    payload JSONB NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
 -- Insert default admin user (password: changeme)
 INSERT INTO users (username, password_hash, email, role) VALUES (
     'admin',
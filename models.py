@@ -5,12 +5,13 @@ Database models for Web Monitor v2
 
 from sqlalchemy import (
     Column, Integer, String, Text, Float, Boolean, DateTime,
-    ForeignKey, ARRAY, JSON, create_engine
+    ForeignKey, ARRAY, JSON, Index, create_engine
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from sqlalchemy.sql import func
 from datetime import datetime
+from functools import lru_cache
 import os
 
 Base = declarative_base()
@@ -106,6 +107,14 @@ class Article(Base):
     query_source = Column(String(255))
     relevance_score = Column(Float, default=0)
 
+    # Hot query paths: dashboard metrics and alert checks filter on
+    # (project_id, scraped_at); the sentiment averages additionally
+    # read sentiment_score
+    __table_args__ = (
+        Index('ix_articles_project_scraped_at', 'project_id', 'scraped_at'),
+        Index('ix_articles_project_sentiment_score', 'project_id', 'sentiment_score'),
+    )
+
     # Relationships
     project = relationship("Project", back_populates="articles")
 
@@ -180,8 +189,23 @@ class APILog(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
-def get_engine():
-    """Get SQLAlchemy engine from DATABASE_URL"""
+@lru_cache(maxsize=1)
+def _cached_engine(database_url):
+    """One engine (and connection pool) per process, not per call"""
+    return create_engine(
+        database_url,
+        pool_size=10,
+        pool_pre_ping=True,
+        pool_recycle=1800
+    )
+
+
+@lru_cache(maxsize=1)
+def _session_factory(database_url):
+    return sessionmaker(bind=_cached_engine(database_url))
+
+
+def _database_url():
     database_url = os.getenv('DATABASE_URL')
     if not database_url:
         raise ValueError("DATABASE_URL not configured")
@@ -190,14 +214,17 @@ def get_engine():
     if database_url.startswith('postgres://'):
         database_url = database_url.replace('postgres://', 'postgresql://', 1)
 
-    return create_engine(database_url)
+    return database_url
+
+
+def get_engine():
+    """Get SQLAlchemy engine from DATABASE_URL"""
+    return _cached_engine(_database_url())
 
 
 def get_session():
-    """Get SQLAlchemy session"""
-    engine = get_engine()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Get SQLAlchemy session from a cached session factory"""
+    return _session_factory(_database_url())()
 
 
 def create_tables():
@@ -4,7 +4,7 @@ Checks conditions and sends notifications
 """
 
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -24,115 +24,141 @@ class AlertEngine:
         """
         Check all alert conditions for a project
 
+        Triggered alerts are collected and flushed together: one project
+        lookup, one SMTP session for all emails, one multi-row UPDATE.
+
         Args:
             project_id: Project ID
             new_articles_count: Number of new articles just scraped
         """
-        self.check_spike_alerts(project_id, new_articles_count)
-        self.check_sentiment_alerts(project_id)
+        triggered = []
+        triggered += self.check_spike_alerts(project_id, new_articles_count)
+        triggered += self.check_sentiment_alerts(project_id)
+        self._flush_triggers(project_id, triggered)
 
-    def check_spike_alerts(self, project_id: int, new_articles: int):
+    def check_spike_alerts(self, project_id: int, new_articles: int) -> List:
         """Check mention spike alerts"""
         cursor = self.db.cursor()
-        cursor.execute("""
-            SELECT COUNT(*)::float / 7 as avg_daily
-            FROM articles
-            WHERE project_id = %s
-            AND scraped_at >= NOW() - INTERVAL '7 days'
-        """, (project_id,))
 
-        result = cursor.fetchone()
-        avg_daily = result['avg_daily'] if result else 0
-
-        # Get active spike alerts
+        # One round-trip: the 7-day average rides along with the alert
+        # rows, and the threshold comparison runs in SQL so only alerts
+        # that actually fire come back
         cursor.execute("""
-            SELECT * FROM alerts
-            WHERE project_id = %s
-            AND type = 'spike_detection'
-            AND is_active = TRUE
-        """, (project_id,))
-
-        alerts = cursor.fetchall()
-
-        for alert in alerts:
-            threshold = alert['threshold']
-
-            if new_articles > avg_daily * threshold:
-                self._trigger_alert(
-                    alert,
-                    "Spike Menzioni Rilevato",
-                    f"{new_articles} nuovi articoli (media storica: {avg_daily:.1f})",
-                    project_id
-                )
+            WITH stats AS (
+                SELECT COUNT(*)::float / 7 as avg_daily
+                FROM articles
+                WHERE project_id = %(pid)s
+                AND scraped_at >= NOW() - INTERVAL '7 days'
+            )
+            SELECT alerts.*, stats.avg_daily
+            FROM alerts, stats
+            WHERE alerts.project_id = %(pid)s
+            AND alerts.type = 'spike_detection'
+            AND alerts.is_active = TRUE
+            AND %(new)s > stats.avg_daily * alerts.threshold
+        """, {'pid': project_id, 'new': new_articles})
+
+        return [
+            (
+                alert,
+                "Spike Menzioni Rilevato",
+                f"{new_articles} nuovi articoli (media storica: {alert['avg_daily']:.1f})"
+            )
+            for alert in cursor.fetchall()
+        ]
 
-    def check_sentiment_alerts(self, project_id: int):
+    def check_sentiment_alerts(self, project_id: int) -> List:
         """Check sentiment shift alerts"""
         cursor = self.db.cursor()
 
-        # Recent sentiment (24h)
+        # One round-trip: both sentiment windows come from a single
+        # 30-day scan (FILTER splits recent vs historical), and the
+        # delta-vs-threshold check runs in SQL so only firing alerts
+        # come back (no rows when there is no recent sentiment)
         cursor.execute("""
-            SELECT AVG(sentiment_score) as avg_sentiment
-            FROM articles
-            WHERE project_id = %s
-            AND scraped_at >= NOW() - INTERVAL '24 hours'
-            AND sentiment_score IS NOT NULL
-        """, (project_id,))
-
-        recent = cursor.fetchone()
-        recent_score = recent['avg_sentiment'] if recent and recent['avg_sentiment'] else None
+            WITH stats AS (
+                SELECT
+                    AVG(sentiment_score) FILTER (
+                        WHERE scraped_at >= NOW() - INTERVAL '24 hours'
+                    ) as recent_score,
+                    COALESCE(AVG(sentiment_score) FILTER (
+                        WHERE scraped_at < NOW() - INTERVAL '24 hours'
+                    ), 0) as historical_score
+                FROM articles
+                WHERE project_id = %(pid)s
+                AND scraped_at >= NOW() - INTERVAL '30 days'
+                AND sentiment_score IS NOT NULL
+            )
+            SELECT alerts.*, stats.recent_score, stats.historical_score
+            FROM alerts, stats
+            WHERE alerts.project_id = %(pid)s
+            AND alerts.type = 'sentiment_shift'
+            AND alerts.is_active = TRUE
+            AND stats.recent_score IS NOT NULL
+            AND ABS(stats.recent_score - stats.historical_score) > alerts.threshold
+        """, {'pid': project_id})
+
+        triggered = []
+        for alert in cursor.fetchall():
+            recent_score = alert['recent_score']
+            historical_score = alert['historical_score']
+            trend = "positivo" if recent_score > historical_score else "negativo"
+            triggered.append((
+                alert,
+                "Cambio Sentiment Rilevato",
+                f"Sentiment attuale: {recent_score:+.2f} (storico: {historical_score:+.2f})\nTrend: {trend}"
+            ))
+
+        return triggered
+
+    def _flush_triggers(self, project_id: int, triggered: List):
+        """
+        Send notifications and record triggers for all fired alerts.
 
-        if recent_score is None:
+        One project lookup, one SMTP session shared by every email and a
+        single multi-row UPDATE instead of per-alert round-trips.
+        """
+        if not triggered:
             return
 
-        # Historical sentiment (30 days)
-        cursor.execute("""
-            SELECT AVG(sentiment_score) as avg_sentiment
-            FROM articles
-            WHERE project_id = %s
-            AND scraped_at >= NOW() - INTERVAL '30 days'
-            AND scraped_at < NOW() - INTERVAL '24 hours'
-            AND sentiment_score IS NOT NULL
-        """, (project_id,))
-
-        historical = cursor.fetchone()
-        historical_score = historical['avg_sentiment'] if historical and historical['avg_sentiment'] else 0
-
-        # Get active sentiment alerts
-        cursor.execute("""
-            SELECT * FROM alerts
-            WHERE project_id = %s
-            AND type = 'sentiment_shift'
-            AND is_active = TRUE
-        """, (project_id,))
-
-        alerts = cursor.fetchall()
-
-        for alert in alerts:
-            threshold = alert['threshold']
-            delta = abs(recent_score - historical_score)
-
-            if delta > threshold:
-                trend = "positivo" if recent_score > historical_score else "negativo"
-                self._trigger_alert(
-                    alert,
-                    "Cambio Sentiment Rilevato",
-                    f"Sentiment attuale: {recent_score:+.2f} (storico: {historical_score:+.2f})\nTrend: {trend}",
-                    project_id
-                )
-
-    def _trigger_alert(self, alert: Dict, subject: str, message: str, project_id: int):
-        """Send alert notification"""
         cursor = self.db.cursor()
 
-        # Get project info
+        # Get project info (once for all fired alerts)
         cursor.execute("""
             SELECT name, brand FROM projects WHERE id = %s
         """, (project_id,))
 
         project = cursor.fetchone()
 
-        # Build email
-        html = f"""
+        # One message per fired alert with every recipient in Bcc: the
+        # HTML is formatted and the MIME tree built once however many
+        # addresses are subscribed
+        messages = []
+        for alert, subject, message in triggered:
+            html = self._build_email(project, subject, message)
+            msg = MIMEMultipart('alternative')
+            msg['From'] = self.smtp_user
+            msg['To'] = self.smtp_user
+            msg['Bcc'] = ', '.join(alert['email_recipients'])
+            msg['Subject'] = f"[Web Monitor] {subject}"
+            msg.attach(MIMEText(html, 'html', 'utf-8'))
+            messages.append(msg)
+
+        self._send_messages(messages)
+
+        # Update alert records in one statement
+        cursor.execute("""
+            UPDATE alerts
+            SET last_triggered = NOW(),
+                trigger_count = trigger_count + 1
+            WHERE id = ANY(%s)
+        """, ([alert['id'] for alert, _, _ in triggered],))
+
+        self.db.commit()
+
+    def _build_email(self, project: Dict, subject: str, message: str) -> str:
+        """Render the alert notification HTML"""
+        return f"""
         <html>
         <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
             <div style="background: #f8f9fa; padding: 20px; border-radius: 8px;">
@@ -167,44 +193,26 @@ class AlertEngine:
         </html>
         """
 
-        # Send to all recipients
-        for email in alert['email_recipients']:
-            self._send_email(
-                email,
-                f"[Web Monitor] {subject}",
-                html
-            )
-
-        # Update alert record
-        cursor.execute("""
-            UPDATE alerts
-            SET last_triggered = NOW(),
-                trigger_count = trigger_count + 1
-            WHERE id = %s
-        """, (alert['id'],))
-
-        self.db.commit()
+    def _send_messages(self, messages: List):
+        """Send all queued emails over a single SMTP session"""
+        if not messages:
+            return
 
-    def _send_email(self, to: str, subject: str, html: str):
-        """Send HTML email via SMTP"""
         if not self.smtp_user or not self.smtp_pass:
-            print(f"SMTP not configured, skipping email to {to}")
+            print(f"SMTP not configured, skipping {len(messages)} emails")
             return
 
-        msg = MIMEMultipart('alternative')
-        msg['From'] = self.smtp_user
-        msg['To'] = to
-        msg['Subject'] = subject
-
-        msg.attach(MIMEText(html, 'html', 'utf-8'))
-
         try:
             with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.smtp_user, self.smtp_pass)
-                server.send_message(msg)
 
-            print(f"Email sent to {to}")
+                for msg in messages:
+                    try:
+                        server.send_message(msg)
+                        print(f"Email sent to {msg['Bcc']}")
+                    except Exception as e:
+                        print(f"Email send failed to {msg['Bcc']}: {e}")
 
         except Exception as e:
-            print(f"Email send failed to {to}: {e}")
+            print(f"SMTP connection failed: {e}")
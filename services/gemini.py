@@ -6,10 +6,79 @@ Memory-optimized for Railway workers
 
 import google.generativeai as genai
 from typing import List, Dict, Callable, Optional
+import asyncio
 import os
-import json
+import orjson
 import gc
-import time
+
+# Concurrent in-flight Gemini calls during batch analysis. Modest by
+# default: high enough to overlap the ~2-5s network waits, low enough
+# to stay friendly to rate limits and the 512MB Railway workers.
+# Override per deployment without a code change.
+MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', 4))
+
+# Articles packed into one analysis prompt: the instruction overhead is
+# paid once per group instead of once per article
+BATCH_PROMPT_SIZE = 10
+
+# Per-call deadline in seconds. Without it a hung Gemini call can sit on
+# the semaphore for the whole Celery soft time limit (3000s)
+GEMINI_TIMEOUT = int(os.getenv('GEMINI_TIMEOUT', 30))
+
+# Attempts per article before giving up and using the neutral fallback
+MAX_ATTEMPTS = 3
+
+# Shared generation config for per-article analysis
+_ANALYSIS_CONFIG = {
+    'temperature': 0.3,
+    'top_p': 0.8,
+    'max_output_tokens': 500  # Minimal for single article
+}
+
+# Prompt templates built once at import; per call only the brand and
+# article fields are formatted in
+_ANALYSIS_PROMPT = """Analyze this news article for brand "{brand}".
+
+Return JSON with:
+- sentiment: "positive", "negative", or "neutral"
+- sentiment_score: float -1.0 to +1.0
+- topics: array of 2-3 topics
+- entities: {{"people": [], "organizations": [], "locations": []}}
+- summary: 1 sentence summary in Italian
+- relevance_score: 0-100
+
+Article:
+Title: {title}
+Snippet: {snippet}
+
+Return ONLY valid JSON, no markdown."""
+
+_GROUP_PROMPT = """Analyze these {count} news articles for brand "{brand}".
+
+For EACH article return JSON with:
+- sentiment: "positive", "negative", or "neutral"
+- sentiment_score: float -1.0 to +1.0
+- topics: array of 2-3 topics
+- entities: {{"people": [], "organizations": [], "locations": []}}
+- summary: 1 sentence summary in Italian
+- relevance_score: 0-100
+
+Articles:
+{listing}
+
+Return ONLY valid JSON: {{"results": [one object per article, in input order]}}
+No markdown."""
+
+
+def _strip_json_fences(text: str) -> str:
+    """Remove the ```json fences Gemini sometimes wraps around output"""
+    return (
+        text.strip()
+        .removeprefix('```json')
+        .removeprefix('```')
+        .removesuffix('```')
+        .strip()
+    )
 
 
 class GeminiAnalyzer:
@@ -34,113 +103,175 @@ class GeminiAnalyzer:
         self.model = None
         gc.collect()
 
+    def _build_analysis_prompt(self, article: Dict, brand: str) -> str:
+        return _ANALYSIS_PROMPT.format(
+            brand=brand,
+            title=article.get('title', '')[:200],
+            snippet=article.get('snippet', '')[:300]
+        )
+
+    def _merge_analysis(self, result: Dict, article: Dict) -> Dict:
+        """Merge one parsed analysis object into its article"""
+        return {
+            **article,
+            'sentiment': result.get('sentiment', 'neutral'),
+            'sentiment_score': float(result.get('sentiment_score', 0)),
+            'topics': result.get('topics', []),
+            'entities': result.get('entities', {}),
+            'summary': result.get('summary', article.get('snippet', '')[:200]),
+            'relevance_score': float(result.get('relevance_score', 50))
+        }
+
+    def _parse_analysis(self, text: str, article: Dict) -> Dict:
+        """Strip markdown fences and merge the parsed fields into the article"""
+        return self._merge_analysis(orjson.loads(_strip_json_fences(text)), article)
+
+    def _default_analysis(self, article: Dict) -> Dict:
+        """Neutral fallback when the model call or parse fails"""
+        return {
+            **article,
+            'sentiment': 'neutral',
+            'sentiment_score': 0.0,
+            'topics': [],
+            'entities': {},
+            'summary': article.get('snippet', '')[:200],
+            'relevance_score': 50.0
+        }
+
     def analyze_single_article(self, article: Dict, brand: str) -> Dict:
         """
         Analyze a single article - memory efficient version
         """
-        prompt = f"""Analyze this news article for brand "{brand}".
-
-Return JSON with:
-- sentiment: "positive", "negative", or "neutral"
-- sentiment_score: float -1.0 to +1.0
-- topics: array of 2-3 topics
-- entities: {{"people": [], "organizations": [], "locations": []}}
-- summary: 1 sentence summary in Italian
-- relevance_score: 0-100
-
-Article:
-Title: {article.get('title', '')[:200]}
-Snippet: {article.get('snippet', '')[:300]}
-
-Return ONLY valid JSON, no markdown."""
-
         try:
             model = self._get_model()
             response = model.generate_content(
-                prompt,
-                generation_config={
-                    'temperature': 0.3,
-                    'top_p': 0.8,
-                    'max_output_tokens': 500  # Minimal for single article
-                }
+                self._build_analysis_prompt(article, brand),
+                generation_config=_ANALYSIS_CONFIG
             )
-
-            text = response.text.strip()
-            if text.startswith('```json'):
-                text = text[7:]
-            if text.startswith('```'):
-                text = text[3:]
-            if text.endswith('```'):
-                text = text[:-3]
-            text = text.strip()
-
-            result = json.loads(text)
-
-            analyzed = {
-                **article,
-                'sentiment': result.get('sentiment', 'neutral'),
-                'sentiment_score': float(result.get('sentiment_score', 0)),
-                'topics': result.get('topics', []),
-                'entities': result.get('entities', {}),
-                'summary': result.get('summary', article.get('snippet', '')[:200]),
-                'relevance_score': float(result.get('relevance_score', 50))
-            }
-
-            # Cleanup
-            del response, text, result
-            return analyzed
+            return self._parse_analysis(response.text, article)
 
         except Exception as e:
             print(f"Gemini single analysis error: {e}")
-            return {
-                **article,
-                'sentiment': 'neutral',
-                'sentiment_score': 0.0,
-                'topics': [],
-                'entities': {},
-                'summary': article.get('snippet', '')[:200],
-                'relevance_score': 50.0
-            }
+            return self._default_analysis(article)
+
+    def _build_group_prompt(self, group: List[Dict], brand: str) -> str:
+        listing = "\n".join(
+            f"[{i}] Title: {a.get('title', '')[:200]} | Snippet: {a.get('snippet', '')[:300]}"
+            for i, a in enumerate(group)
+        )
+        return _GROUP_PROMPT.format(count=len(group), brand=brand, listing=listing)
+
+    async def _analyze_group_async(self, group, brand, semaphore, on_done):
+        """Analyze a group with one prompt; fall back per article on failure"""
+        async with semaphore:
+            try:
+                model = self._get_model()
+                # Double deadline: group responses are ~10x the tokens
+                response = await asyncio.wait_for(
+                    model.generate_content_async(
+                        self._build_group_prompt(group, brand),
+                        generation_config={
+                            **_ANALYSIS_CONFIG,
+                            'max_output_tokens': 500 * len(group)
+                        }
+                    ),
+                    timeout=GEMINI_TIMEOUT * 2
+                )
+
+                parsed = orjson.loads(_strip_json_fences(response.text))
+                results = parsed.get('results') if isinstance(parsed, dict) else parsed
+                if not isinstance(results, list) or len(results) != len(group):
+                    raise ValueError(f"expected {len(group)} analyses in response")
+
+                analyzed = [
+                    self._merge_analysis(result, article)
+                    for result, article in zip(results, group)
+                ]
+                for _ in group:
+                    on_done()
+                return analyzed
+
+            except Exception as e:
+                print(f"Gemini group analysis error, retrying per article: {e}")
+
+        # Per-article fallback; each call re-acquires the semaphore
+        return list(await asyncio.gather(*[
+            self._analyze_article_async(article, brand, semaphore, on_done)
+            for article in group
+        ]))
+
+    async def _analyze_article_async(self, article, brand, semaphore, on_done):
+        async with semaphore:
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    model = self._get_model()
+                    response = await asyncio.wait_for(
+                        model.generate_content_async(
+                            self._build_analysis_prompt(article, brand),
+                            generation_config=_ANALYSIS_CONFIG
+                        ),
+                        timeout=GEMINI_TIMEOUT
+                    )
+                    result = self._parse_analysis(response.text, article)
+                    break
+                except Exception as e:
+                    print(f"Gemini single analysis error (attempt {attempt + 1}): {e}")
+                    if attempt + 1 < MAX_ATTEMPTS:
+                        await asyncio.sleep(2 ** attempt)
+            else:
+                result = self._default_analysis(article)
+
+        on_done()
+        return result
+
+    async def _batch_analyze_async(self, articles, brand, progress_callback):
+        semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+        total = len(articles)
+        done = 0
+
+        def on_done():
+            nonlocal done
+            done += 1
+            if progress_callback:
+                progress_callback(done, total)
+
+        groups = [
+            articles[i:i + BATCH_PROMPT_SIZE]
+            for i in range(0, len(articles), BATCH_PROMPT_SIZE)
+        ]
+        nested = await asyncio.gather(*[
+            self._analyze_group_async(group, brand, semaphore, on_done)
+            for group in groups
+        ])
+        return [result for group_results in nested for result in group_results]
 
     def batch_analyze_articles(
         self,
         articles: List[Dict],
         brand: str,
-        batch_size: int = 1,  # Process one at a time for memory safety
+        batch_size: int = 1,  # Kept for API compatibility, unused
         progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> List[Dict]:
         """
-        Analyze articles one by one for memory safety
+        Analyze articles in groups of BATCH_PROMPT_SIZE per prompt, with
+        the groups running concurrently (network-bound, so wall time is
+        roughly group count / MAX_CONCURRENCY round-trips)
 
         Args:
             articles: List of articles with title + snippet
             brand: Brand name for context
-            batch_size: Ignored, always processes one at a time
+            batch_size: Ignored, grouping is fixed at BATCH_PROMPT_SIZE
             progress_callback: Optional callback(current, total) for progress
 
         Returns:
-            Analyzed articles with AI fields added
+            Analyzed articles with AI fields added, in input order
         """
-        analyzed = []
-        total = len(articles)
+        analyzed = list(asyncio.run(
+            self._batch_analyze_async(articles, brand, progress_callback)
+        ))
 
-        # Force garbage collection before starting
-        gc.collect()
-
-        for i, article in enumerate(articles):
-            # Progress callback
-            if progress_callback:
-                progress_callback(i + 1, total)
-
-            # Analyze single article
-            result = self.analyze_single_article(article, brand)
-            analyzed.append(result)
-
-            # Release model and collect garbage after EVERY article
-            self._release_model()
-
-            # Small delay to avoid rate limiting
-            time.sleep(0.3)
+        # Release model and collect garbage once the batch is done
+        self._release_model()
 
         return analyzed
 
@@ -190,14 +321,8 @@ No markdown, no explanation."""
         try:
             model = self._get_model()
             response = model.generate_content(prompt)
-            text = response.text.strip()
-
-            if text.startswith('```json'):
-                text = text[7:]
-            if text.endswith('```'):
-                text = text[:-3]
 
-            result = json.loads(text.strip())
+            result = orjson.loads(_strip_json_fences(response.text))
             self._release_model()
             return result
 
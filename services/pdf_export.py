@@ -12,11 +12,27 @@ from reportlab.platypus import (
     PageBreak
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+from xml.sax.saxutils import escape
+import heapq
 import io
 
 
+def _safe(text, limit: int = None) -> str:
+    """Truncate and escape user content for reportlab's XML mini-parser.
+
+    Unescaped & / < / > in scraped titles make Paragraph throw or
+    mis-render, and the parser is slow on long inputs, so clean once
+    up front.
+    """
+    text = '' if text is None else str(text)
+    if limit is not None:
+        text = text[:limit]
+    return escape(text, {'"': '&quot;'})
+
+
 class PDFExporter:
     def __init__(self):
         self.styles = getSampleStyleSheet()
@@ -49,8 +65,9 @@ class PDFExporter:
         self,
         project: Dict,
         articles: List[Dict],
-        period_days: int = 30
-    ) -> bytes:
+        period_days: int = 30,
+        out_stream=None
+    ) -> Optional[bytes]:
         """
         Generate PDF report
 
@@ -58,11 +75,16 @@ class PDFExporter:
             project: Project dict
             articles: List of articles
             period_days: Report period
+            out_stream: Optional writable binary stream (e.g. an open
+                file or HTTP response body). When given, the PDF is
+                written there directly and nothing is returned, which
+                avoids buffering the whole document plus a bytes copy
+                in memory.
 
         Returns:
-            PDF bytes
+            PDF bytes, or None when out_stream is provided
         """
-        buffer = io.BytesIO()
+        buffer = out_stream if out_stream is not None else io.BytesIO()
         doc = SimpleDocTemplate(
             buffer,
             pagesize=A4,
@@ -113,10 +135,12 @@ class PDFExporter:
         # Sentiment distribution
         story.append(Paragraph("Distribuzione Sentiment", self.styles['SectionHeader']))
 
-        sentiment_counts = {'positive': 0, 'neutral': 0, 'negative': 0}
-        for a in articles:
-            sentiment = a.get('sentiment', 'neutral')
-            sentiment_counts[sentiment] = sentiment_counts.get(sentiment, 0) + 1
+        counts = Counter(a.get('sentiment', 'neutral') for a in articles)
+        sentiment_counts = {
+            'positive': counts['positive'],
+            'neutral': counts['neutral'],
+            'negative': counts['negative']
+        }
 
         total = len(articles)
         sentiment_data = [
@@ -151,21 +175,28 @@ class PDFExporter:
         story.append(Paragraph("Top Articoli per Rilevanza", self.styles['SectionHeader']))
         story.append(Spacer(1, 0.5*cm))
 
-        # Sort by relevance
-        sorted_articles = sorted(
-            articles,
-            key=lambda x: x.get('relevance_score', 0),
-            reverse=True
-        )[:15]
+        # Top 15 by relevance without sorting the full list
+        sorted_articles = heapq.nlargest(
+            15, articles, key=lambda x: x.get('relevance_score', 0)
+        )
 
         for i, article in enumerate(sorted_articles, 1):
+            # Escape + truncate user content once before Paragraph's
+            # XML parser sees it
+            title = _safe(article.get('title') or 'No title', 200)
+            source = _safe(article.get('source') or 'N/A', 100)
+            summary = _safe(
+                article.get('summary') or article.get('snippet') or 'No summary',
+                300
+            )
+            url = _safe(article.get('url') or '#')
+
             # Article header
-            title_text = f"<b>{i}. {article.get('title', 'No title')}</b>"
-            story.append(Paragraph(title_text, self.styles['Normal']))
+            story.append(Paragraph(f"<b>{i}. {title}</b>", self.styles['Normal']))
 
             # Metadata
             meta_text = f"""
-            <i>Fonte: {article.get('source', 'N/A')} |
+            <i>Fonte: {source} |
             Data: {article.get('published_at', 'N/A')}</i><br/>
             <b>Sentiment:</b> {article.get('sentiment', 'N/A').capitalize()} ({article.get('sentiment_score', 0):+.2f}) |
             <b>Rilevanza:</b> {article.get('relevance_score', 0):.0f}/100
@@ -173,11 +204,9 @@ class PDFExporter:
             story.append(Paragraph(meta_text, self.styles['Normal']))
 
             # Summary
-            summary = article.get('summary', article.get('snippet', 'No summary'))[:300]
             story.append(Paragraph(summary, self.styles['Normal']))
 
             # URL
-            url = article.get("url", "#")
             url_text = f'<a href="{url}" color="blue">{url}</a>'
             story.append(Paragraph(url_text, self.styles['Normal']))
 
@@ -185,5 +214,6 @@ class PDFExporter:
 
         # Build PDF
         doc.build(story)
-        buffer.seek(0)
+        if out_stream is not None:
+            return None
         return buffer.getvalue()
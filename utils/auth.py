@@ -4,13 +4,117 @@ Pro Web Consulting Branding
 """
 
 import streamlit as st
-import hashlib
+import hmac
 import os
+from pathlib import Path
+
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+from utils.branding import BASE_CSS, LOGO_URL, minify_css
+
+# Login CSS minified once at import and published to static/login.css
+# (same pattern as app.py): the browser caches the stylesheet as a
+# plain HTTP asset and only the link tag rides the websocket on reruns.
+_LOGIN_CSS = minify_css(BASE_CSS + """
+    /* Login container */
+    .login-container {
+        max-width: 400px;
+        margin: 0 auto;
+        padding: 2rem;
+        background: rgba(255,255,255,0.03);
+        border: 1px solid rgba(255,255,255,0.1);
+        border-radius: 16px;
+        margin-top: 10vh;
+    }
+
+    .login-logo {
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+
+    .login-logo img {
+        max-width: 200px;
+    }
+
+    .login-title {
+        color: white;
+        text-align: center;
+        font-size: 1.5rem;
+        font-weight: 600;
+        margin-bottom: 0.5rem;
+    }
+
+    .login-subtitle {
+        color: rgba(255,255,255,0.6);
+        text-align: center;
+        font-size: 0.875rem;
+        margin-bottom: 2rem;
+    }
+
+    /* Input styling */
+    .stTextInput > div > div > input {
+        background: rgba(255,255,255,0.05) !important;
+        border: 1px solid rgba(255,255,255,0.1) !important;
+        border-radius: 8px !important;
+        color: white !important;
+        padding: 0.75rem 1rem !important;
+    }
+
+    .stTextInput > div > div > input:focus {
+        border-color: #6B1AC7 !important;
+        box-shadow: 0 0 0 2px rgba(107, 26, 199, 0.2) !important;
+    }
+
+    .stTextInput > label {
+        color: rgba(255,255,255,0.7) !important;
+    }
+
+    /* Button */
+    .stButton > button {
+        width: 100%;
+        background: linear-gradient(135deg, #6B1AC7 0%, #5a15a8 100%) !important;
+        color: white !important;
+        border: none !important;
+        border-radius: 8px !important;
+        padding: 0.75rem 1.5rem !important;
+        font-weight: 600 !important;
+        margin-top: 1rem !important;
+    }
+
+    .stButton > button:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 15px rgba(107, 26, 199, 0.4);
+    }
+
+    /* Error message */
+    .stAlert {
+        background: rgba(231, 76, 60, 0.1) !important;
+        border: 1px solid #E74C3C !important;
+        border-radius: 8px !important;
+    }
+""")
+
+_LOGIN_CSS_FILE = Path(__file__).parent.parent / 'static' / 'login.css'
+if not _LOGIN_CSS_FILE.exists() or _LOGIN_CSS_FILE.read_text() != _LOGIN_CSS:
+    _LOGIN_CSS_FILE.parent.mkdir(exist_ok=True)
+    _LOGIN_CSS_FILE.write_text(_LOGIN_CSS)
+
+_LOGIN_CSS_LINK = '<link rel="stylesheet" href="app/static/login.css">'
+
+# Argon2id with moderate cost: ~50ms per verify, slow enough to make
+# offline guessing impractical without hurting interactive login
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=64_000, parallelism=2)
 
 
 def hash_password(password: str) -> str:
-    """Hash password with SHA256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """
+    Hash a password with argon2id.
+
+    Use this to generate the value for the ADMIN_PASS_HASH env var:
+        python -c "from utils.auth import hash_password; print(hash_password('...'))"
+    """
+    return _password_hasher.hash(password)
 
 
 def check_password():
@@ -26,9 +130,31 @@ def check_password():
 
         # Get from env
         admin_user = os.getenv("ADMIN_USER", "admin")
-        admin_pass = os.getenv("ADMIN_PASS", "changeme")
+        admin_hash = os.getenv("ADMIN_PASS_HASH")
+
+        # Constant-time compares so neither check leaks via timing
+        # (on bytes: compare_digest rejects non-ASCII str operands)
+        user_ok = hmac.compare_digest(username.encode(), admin_user.encode())
+
+        if admin_hash:
+            try:
+                _password_hasher.verify(admin_hash, password)
+                pass_ok = True
+            except InvalidHashError:
+                # Misconfigured ADMIN_PASS_HASH (e.g. the .env.example
+                # placeholder): fail auth instead of crashing the page
+                print("ADMIN_PASS_HASH is not a valid argon2 hash - "
+                      "regenerate it with utils.auth.hash_password")
+                pass_ok = False
+            except VerificationError:
+                pass_ok = False
+        else:
+            # Legacy deployments that still set a plaintext ADMIN_PASS
+            pass_ok = hmac.compare_digest(
+                password.encode(), os.getenv("ADMIN_PASS", "changeme").encode()
+            )
 
-        if username == admin_user and password == admin_pass:
+        if user_ok and pass_ok:
             st.session_state["authenticated"] = True
             st.session_state["current_user"] = username
             del st.session_state["password"]  # Don't store password
@@ -39,111 +165,17 @@ def check_password():
     if st.session_state.get("authenticated", False):
         return True
 
-    # Custom CSS for login page
-    st.markdown("""
-    <style>
-        /* Hide Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        .stDeployButton {display: none;}
-        div[data-testid="stToolbar"] {display: none;}
-        div[data-testid="stDecoration"] {display: none;}
-        div[data-testid="stStatusWidget"] {display: none;}
-        .viewerBadge_container__r5tak {display: none;}
-        .styles_viewerBadge__CvC9N {display: none;}
-
-        /* Background */
-        .stApp {
-            background: linear-gradient(135deg, #0a1628 0%, #1a1a3e 50%, #0f2744 100%);
-        }
-
-        /* Login container */
-        .login-container {
-            max-width: 400px;
-            margin: 0 auto;
-            padding: 2rem;
-            background: rgba(255,255,255,0.03);
-            border: 1px solid rgba(255,255,255,0.1);
-            border-radius: 16px;
-            margin-top: 10vh;
-        }
-
-        .login-logo {
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-
-        .login-logo img {
-            max-width: 200px;
-        }
-
-        .login-title {
-            color: white;
-            text-align: center;
-            font-size: 1.5rem;
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-        }
-
-        .login-subtitle {
-            color: rgba(255,255,255,0.6);
-            text-align: center;
-            font-size: 0.875rem;
-            margin-bottom: 2rem;
-        }
-
-        /* Input styling */
-        .stTextInput > div > div > input {
-            background: rgba(255,255,255,0.05) !important;
-            border: 1px solid rgba(255,255,255,0.1) !important;
-            border-radius: 8px !important;
-            color: white !important;
-            padding: 0.75rem 1rem !important;
-        }
-
-        .stTextInput > div > div > input:focus {
-            border-color: #6B1AC7 !important;
-            box-shadow: 0 0 0 2px rgba(107, 26, 199, 0.2) !important;
-        }
-
-        .stTextInput > label {
-            color: rgba(255,255,255,0.7) !important;
-        }
-
-        /* Button */
-        .stButton > button {
-            width: 100%;
-            background: linear-gradient(135deg, #6B1AC7 0%, #5a15a8 100%) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 8px !important;
-            padding: 0.75rem 1.5rem !important;
-            font-weight: 600 !important;
-            margin-top: 1rem !important;
-        }
-
-        .stButton > button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 15px rgba(107, 26, 199, 0.4);
-        }
-
-        /* Error message */
-        .stAlert {
-            background: rgba(231, 76, 60, 0.1) !important;
-            border: 1px solid #E74C3C !important;
-            border-radius: 8px !important;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Shared chrome/background + login-only rules, served as a cached
+    # static asset
+    st.markdown(_LOGIN_CSS_LINK, unsafe_allow_html=True)
 
     # Centered login form
     col1, col2, col3 = st.columns([1, 2, 1])
 
     with col2:
-        st.markdown("""
+        st.markdown(f"""
         <div class="login-logo">
-            <img src="https://ai-landscape.prowebconsulting.net/assets/pwc-logo.svg" alt="Pro Web Consulting">
+            <img src="{LOGO_URL}" alt="Pro Web Consulting">
         </div>
         <h2 class="login-title">Web Monitor</h2>
         <p class="login-subtitle">Accedi per gestire i tuoi progetti di monitoraggio</p>
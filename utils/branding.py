@@ -0,0 +1,50 @@
+"""
+Shared Pro Web Consulting branding fragments
+
+The dashboard and the login page used to carry their own copies of the
+hide-Streamlit-chrome rules and the background gradient; keeping them
+here means the two pages load one definition and cannot drift apart.
+"""
+
+import re
+from pathlib import Path
+
+# The cross-origin logo fetch sits on the first-paint critical path.
+# Prefer a local copy served from static/ (drop it there at build time:
+#   curl -o static/pwc-logo.svg <remote url>
+# ) and fall back to the remote asset when it is absent.
+_REMOTE_LOGO = "https://ai-landscape.prowebconsulting.net/assets/pwc-logo.svg"
+_LOCAL_LOGO = Path(__file__).resolve().parent.parent / 'static' / 'pwc-logo.svg'
+
+if _LOCAL_LOGO.exists():
+    LOGO_PATH = str(_LOCAL_LOGO)           # filesystem path for st.logo/page_icon
+    LOGO_URL = "app/static/pwc-logo.svg"   # served URL for raw <img> tags
+else:
+    LOGO_PATH = LOGO_URL = _REMOTE_LOGO
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace; no semantic changes"""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};:,>])\s*', r'\1', css)
+    return css.strip()
+
+# Hide Streamlit chrome + shared dark background
+BASE_CSS = """
+    /* ===== HIDE STREAMLIT DEFAULT ELEMENTS ===== */
+    /* Toolbar and "Made with Streamlit" badge are hidden by
+       client.toolbarMode = "minimal" in .streamlit/config.toml; the
+       old per-release hashed selectors are gone */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+    .stDeployButton {display: none;}
+    div[data-testid="stDecoration"] {display: none;}
+    div[data-testid="stStatusWidget"] {display: none;}
+
+    /* ===== MAIN BACKGROUND ===== */
+    .stApp {
+        background: linear-gradient(135deg, #0a1628 0%, #1a1a3e 50%, #0f2744 100%);
+    }
+"""
@@ -4,17 +4,22 @@ Database connection utilities
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
 import os
+import threading
 from urllib.parse import urlparse
 
+# Process-wide pool, created lazily on first checkout
+_pool = None
+_pool_lock = threading.Lock()
 
-def get_db_connection():
-    """
-    Get PostgreSQL connection
+POOL_MIN_CONN = int(os.getenv('DB_POOL_MIN', 4))
+POOL_MAX_CONN = int(os.getenv('DB_POOL_MAX', 30))
 
-    Returns:
-        psycopg2 connection with RealDictCursor
-    """
+
+def _connection_kwargs():
+    """Parse DATABASE_URL into psycopg2 connect kwargs"""
     database_url = os.getenv('DATABASE_URL')
 
     if not database_url:
@@ -23,18 +28,85 @@ def get_db_connection():
     # Parse Railway's DATABASE_URL format
     url = urlparse(database_url)
 
-    conn = psycopg2.connect(
-        host=url.hostname,
-        port=url.port,
-        user=url.username,
-        password=url.password,
-        database=url.path[1:],  # Remove leading /
-        cursor_factory=RealDictCursor
-    )
+    return {
+        'host': url.hostname,
+        'port': url.port,
+        'user': url.username,
+        'password': url.password,
+        'database': url.path[1:],  # Remove leading /
+        'cursor_factory': RealDictCursor
+    }
+
+
+def get_pool():
+    """Get (or lazily create) the process-wide connection pool"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadedConnectionPool(
+                    POOL_MIN_CONN, POOL_MAX_CONN, **_connection_kwargs()
+                )
+    return _pool
+
+
+def checkout_connection():
+    """
+    Check a pre-pinged connection out of the pool.
+
+    Callers own the checkout and must return it with
+    get_pool().putconn(conn); prefer pooled_connection() wherever a
+    with-block fits the control flow.
+    """
+    pool = get_pool()
+    conn = pool.getconn()
+
+    # Pre-ping: replace dead connections transparently
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+    except psycopg2.Error:
+        pool.putconn(conn, close=True)
+        conn = pool.getconn()
 
     return conn
 
 
+@contextmanager
+def pooled_connection():
+    """
+    Check a connection out of the pool and return it when done.
+
+    Pre-pings the connection before handing it out so callers never
+    see a stale socket after a DB restart.
+
+    Usage:
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            ...
+    """
+    conn = checkout_connection()
+    try:
+        yield conn
+    finally:
+        get_pool().putconn(conn)
+
+
+def get_db_connection():
+    """
+    Get PostgreSQL connection
+
+    Returns:
+        psycopg2 connection with RealDictCursor
+
+    Note: callers own the connection and must close() it. Long-running
+    processes should prefer pooled_connection() to avoid a TCP+auth
+    handshake per call.
+    """
+    return psycopg2.connect(**_connection_kwargs())
+
+
 def init_database():
     """
     Initialize database schema
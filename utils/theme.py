@@ -0,0 +1,26 @@
+"""
+Shared Plotly theme for dashboard figures
+"""
+
+from types import MappingProxyType
+
+# Static chart config, built once at module import instead of on every
+# Streamlit rerun. Read-only: merge per-figure overrides with
+# {**PLOTLY_LAYOUT, ...} or update_layout instead of mutating.
+PLOTLY_LAYOUT = MappingProxyType({
+    'plot_bgcolor': 'rgba(0,0,0,0)',
+    'paper_bgcolor': 'rgba(0,0,0,0)',
+    'font': {'color': 'rgba(255,255,255,0.8)', 'family': 'Inter, sans-serif'},
+    'title': {'font': {'color': 'white', 'size': 16}},
+    'xaxis': {
+        'gridcolor': 'rgba(255,255,255,0.1)',
+        'linecolor': 'rgba(255,255,255,0.2)',
+        'tickcolor': 'rgba(255,255,255,0.5)'
+    },
+    'yaxis': {
+        'gridcolor': 'rgba(255,255,255,0.1)',
+        'linecolor': 'rgba(255,255,255,0.2)',
+        'tickcolor': 'rgba(255,255,255,0.5)'
+    },
+    'legend': {'font': {'color': 'rgba(255,255,255,0.8)'}}
+})
@@ -4,18 +4,21 @@ Handles async scraping tasks and scheduling
 With proper logging for Railway
 """
 
-from celery import Celery
+from celery import Celery, group
 from celery.schedules import crontab
 from celery.utils.log import get_task_logger
 from datetime import datetime
+import hashlib
 import os
 import json
 import logging
+import orjson
 import sys
 
-# Configure logging to stdout for Railway
+# Configure logging to stdout for Railway; LOG_LEVEL=WARNING quiets
+# the per-scrape chatter in production
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
     handlers=[logging.StreamHandler(sys.stdout)]
 )
@@ -25,6 +28,14 @@ logger = logging.getLogger('worker')
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 logger.info(f"Celery broker: {REDIS_URL[:30]}...")
 
+# External-API credentials resolved once at import. No hard failure
+# here - app.py imports this module just for the task signatures - but
+# tasks check the flags instead of re-reading the environment.
+DATAFORSEO_LOGIN = os.getenv("DATAFORSEO_LOGIN")
+DATAFORSEO_PASSWORD = os.getenv("DATAFORSEO_PASSWORD")
+HAS_DATAFORSEO = bool(DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD)
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
 # Initialize Celery with explicit task naming
 celery_app = Celery(
     'worker',
@@ -38,11 +49,25 @@ celery_app.conf.update(
     result_serializer='json',
     timezone='Europe/Rome',
     enable_utc=True,
-    task_track_started=True,
+    # No caller reads the STARTED state (app.py only polls ready()/
+    # successful(), scrapes are tracked in scraping_jobs), so skip the
+    # extra backend write per task
+    task_track_started=False,
     task_time_limit=3600,
     task_soft_time_limit=3000,
     task_acks_late=True,
+    # OOM-killed workers should hand their task back to the broker
+    # instead of acking it into the void
+    task_reject_on_worker_lost=True,
     worker_prefetch_multiplier=1,
+    # Match Redis redelivery to the hard time limit (2x margin) so
+    # unacked scrapes are re-queued promptly after a worker dies
+    broker_transport_options={'visibility_timeout': 7200},
+    broker_connection_retry_on_startup=True,
+    # No task uses rate limits; skipping the bookkeeping is free
+    worker_disable_rate_limits=True,
+    # Results only matter while the frontend is polling; a day is plenty
+    result_expires=86400,
     worker_log_format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
     worker_task_log_format='%(asctime)s [%(levelname)s] %(task_name)s[%(task_id)s]: %(message)s',
 )
@@ -64,13 +89,50 @@ celery_app.conf.beat_schedule = {
 task_logger = get_task_logger(__name__)
 
 
+# The old log() helper printed every message a second time with a
+# per-line flush "for Railway"; the stdout StreamHandler configured
+# above already reaches the Railway console, so the duplicate format +
+# flush only burned CPU. Set RAILWAY_VERBOSE=1 to get the raw prints
+# back while debugging log routing.
+_VERBOSE_PRINT = os.getenv('RAILWAY_VERBOSE') == '1'
+
+
 def log(msg, level='info'):
-    """Helper to log to both logger and print (for Railway)"""
+    """Log through the stdout handler (optionally echoed via print)"""
     getattr(logger, level)(msg)
-    print(f"[{level.upper()}] {msg}", flush=True)
+    if _VERBOSE_PRINT and logger.isEnabledFor(getattr(logging, level.upper())):
+        print(f"[{level.upper()}] {msg}", flush=True)
+
+
+# AI fields persisted in article_analysis_cache
+ANALYSIS_FIELDS = (
+    'sentiment', 'sentiment_score', 'topics',
+    'entities', 'summary', 'relevance_score'
+)
+
 
+def _analysis_hash(article):
+    """Content hash identifying an article for analysis reuse"""
+    raw = (article.get('title') or '') + (article.get('snippet') or '')
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
 
-@celery_app.task(bind=True, name='worker.scrape_project', max_retries=3, default_retry_delay=300)
+
+def _default_analysis_inplace(article):
+    """Write neutral analysis fields into the article dict (no copy)"""
+    article['sentiment'] = 'neutral'
+    article['sentiment_score'] = 0.0
+    article['topics'] = []
+    article['entities'] = {}
+    article['summary'] = (article.get('snippet') or '')[:200]
+    article['relevance_score'] = 50.0
+
+
+# ignore_result on the fire-and-forget tasks below: the frontend tracks
+# scrapes through the scraping_jobs table, so writing their return
+# values to the Redis result backend was a wasted SET per completion.
+# suggest_ai / export_pdf / test_task keep their results - app.py polls
+# them via AsyncResult.
+@celery_app.task(bind=True, name='worker.scrape_project', max_retries=3, default_retry_delay=300, ignore_result=True)
 def scrape_project(self, project_id: int):
     """
     Scrape single project with full logging
@@ -78,15 +140,16 @@ def scrape_project(self, project_id: int):
     log(f"=== SCRAPE START === Project ID: {project_id}, Task ID: {self.request.id}")
 
     # Late imports to avoid issues at module load
-    from utils.db import get_db_connection
+    from utils.db import checkout_connection, get_pool
 
     db = None
     cursor = None
     job_id = None
 
     try:
-        # Connect to database
-        db = get_db_connection()
+        # Pooled checkout: one TCP+auth handshake per worker process,
+        # not per task
+        db = checkout_connection()
         cursor = db.cursor()
         log(f"[{project_id}] Database connected")
 
@@ -102,9 +165,15 @@ def scrape_project(self, project_id: int):
         db.commit()
         log(f"[{project_id}] Job record created: {job_id}")
 
-        # Get project config
+        # Project config + keywords + competitors in one round trip
         cursor.execute("""
-            SELECT * FROM projects WHERE id = %s AND status = 'active'
+            SELECT p.*,
+                   (SELECT array_agg(keyword) FROM keywords
+                    WHERE project_id = p.id) AS project_keywords,
+                   (SELECT array_agg(name) FROM competitors
+                    WHERE project_id = p.id) AS project_competitors
+            FROM projects p
+            WHERE p.id = %s AND p.status = 'active'
         """, (project_id,))
 
         project = cursor.fetchone()
@@ -113,42 +182,43 @@ def scrape_project(self, project_id: int):
 
         log(f"[{project_id}] Project: {project['name']} | Brand: {project['brand']} | Market: {project['market']}")
 
-        # Get keywords
-        cursor.execute("SELECT keyword FROM keywords WHERE project_id = %s", (project_id,))
-        keywords = [row['keyword'] for row in cursor.fetchall()]
+        keywords = project['project_keywords'] or []
         log(f"[{project_id}] Keywords: {keywords}")
 
-        # Get competitors
-        cursor.execute("SELECT name FROM competitors WHERE project_id = %s", (project_id,))
-        competitors = [row['name'] for row in cursor.fetchall()]
+        competitors = project['project_competitors'] or []
         log(f"[{project_id}] Competitors: {competitors}")
 
-        # Combine all search terms
-        all_terms = [project['brand']] + keywords + competitors
+        # Combine all search terms. The brand is often re-listed as a
+        # keyword and competitors overlap keywords; dedupe
+        # case-insensitively (keeping the first spelling) so the OR
+        # query and the search-cache key stay canonical
+        seen_terms = {}
+        for term in [project['brand']] + keywords + competitors:
+            if term and term.strip():
+                seen_terms.setdefault(term.strip().lower(), term.strip())
+        all_terms = list(seen_terms.values())
         log(f"[{project_id}] Total search terms: {len(all_terms)}")
 
         if not all_terms:
             raise ValueError("No search terms configured for project")
 
         # Check DataForSEO credentials BEFORE initializing
-        dataforseo_login = os.getenv("DATAFORSEO_LOGIN")
-        dataforseo_pass = os.getenv("DATAFORSEO_PASSWORD")
-
-        if not dataforseo_login or not dataforseo_pass:
+        if not HAS_DATAFORSEO:
             log(f"[{project_id}] ERROR: DataForSEO credentials not configured!", 'error')
             log(f"[{project_id}] Set DATAFORSEO_LOGIN and DATAFORSEO_PASSWORD environment variables", 'error')
             raise ValueError("DataForSEO credentials not configured")
 
-        log(f"[{project_id}] DataForSEO credentials found: {dataforseo_login[:3]}***")
+        log(f"[{project_id}] DataForSEO credentials found: {DATAFORSEO_LOGIN[:3]}***")
 
-        # Initialize DataForSEO (late import)
-        from services.dataforseo import DataForSEOClient
-        dataforseo = DataForSEOClient()
-        log(f"[{project_id}] DataForSEO client initialized")
+        # Per-process singleton: the pooled HTTPS session survives
+        # across tasks, so only the first scrape pays a TLS handshake
+        dataforseo = get_dataforseo()
+        log(f"[{project_id}] DataForSEO client ready")
 
-        # Scrape news
+        # Scrape news (cached for an hour per parameter set)
         log(f"[{project_id}] Calling DataForSEO API...")
-        scrape_result = dataforseo.search_news(
+        scrape_result = _search_news_cached(
+            dataforseo,
             keywords=all_terms,
             market=project['market'],
             days_back=7,
@@ -163,6 +233,15 @@ def scrape_project(self, project_id: int):
         articles = scrape_result['articles']
         log(f"[{project_id}] DataForSEO returned {len(articles)} articles")
 
+        # Multiple keyword queries often return the same URL; keep the
+        # first occurrence so neither Gemini nor Postgres sees the dupes
+        seen = {}
+        for article in articles:
+            seen.setdefault(article['url'], article)
+        if len(seen) != len(articles):
+            log(f"[{project_id}] Dropped {len(articles) - len(seen)} duplicate URLs")
+            articles = list(seen.values())
+
         if not articles:
             cursor.execute("""
                 UPDATE scraping_jobs
@@ -183,8 +262,18 @@ def scrape_project(self, project_id: int):
                 'job_id': job_id
             }
 
-        # Check Gemini credentials
-        gemini_key = os.getenv("GEMINI_API_KEY")
+        # Articles saved by a previous scrape would be discarded by
+        # ON CONFLICT (url) anyway - drop them now so they spend no
+        # Gemini tokens and ship no doomed rows (url is globally UNIQUE,
+        # so the probe is not scoped to the project)
+        cursor.execute(
+            "SELECT url FROM articles WHERE url = ANY(%s)",
+            ([article['url'] for article in articles],)
+        )
+        already_saved = {row['url'] for row in cursor.fetchall()}
+        if already_saved:
+            log(f"[{project_id}] Skipping {len(already_saved)} already-saved articles")
+            articles = [a for a in articles if a['url'] not in already_saved]
 
         # Memory optimization: strict limits for Railway 512MB workers
         MAX_GEMINI_ARTICLES = 15  # Process only 15 articles with AI
@@ -193,125 +282,156 @@ def scrape_project(self, project_id: int):
         # Force garbage collection before AI analysis
         gc.collect()
 
-        if not gemini_key:
+        if not GEMINI_API_KEY:
             log(f"[{project_id}] WARNING: GEMINI_API_KEY not set - skipping AI analysis", 'warning')
-            # Provide default analysis
-            analyzed = []
+            # Default analysis written in place - no per-article copy
             for a in articles:
-                analyzed.append({
-                    **a,
-                    'sentiment': 'neutral',
-                    'sentiment_score': 0.0,
-                    'topics': [],
-                    'entities': {},
-                    'summary': (a.get('snippet') or '')[:200],
-                    'relevance_score': 50.0
-                })
+                _default_analysis_inplace(a)
+            analyzed = articles
         else:
             # Split: AI analysis for most recent articles, default for rest
             articles_for_ai = articles[:MAX_GEMINI_ARTICLES]
             articles_default = articles[MAX_GEMINI_ARTICLES:]
 
-            log(f"[{project_id}] Gemini: analyzing {len(articles_for_ai)} articles (1 at a time), {len(articles_default)} with default")
-
-            # Progress callback for logging
-            def progress_log(current, total):
-                if current == 1 or current == total or current % 5 == 0:
-                    log(f"[{project_id}] AI Progress: {current}/{total} articles")
-
-            from services.gemini import GeminiAnalyzer
-            gemini = GeminiAnalyzer()
-            analyzed = gemini.batch_analyze_articles(
-                articles_for_ai,
-                project['brand'],
-                progress_callback=progress_log
-            )
+            # Re-scrapes keep returning the same articles; reuse stored
+            # analyses (keyed on title+snippet hash) and only send the
+            # unseen ones to Gemini
+            article_hashes = [_analysis_hash(a) for a in articles_for_ai]
+            cursor.execute("""
+                SELECT hash, payload FROM article_analysis_cache
+                WHERE hash = ANY(%s)
+            """, (article_hashes,))
+            cached_payloads = {row['hash']: row['payload'] for row in cursor.fetchall()}
 
-            # Clean up Gemini analyzer aggressively
-            del gemini
-            gc.collect()
+            analyzed = []
+            to_analyze = []
+            to_analyze_hashes = []
+            for article, article_hash in zip(articles_for_ai, article_hashes):
+                if article_hash in cached_payloads:
+                    analyzed.append({**article, **cached_payloads[article_hash]})
+                else:
+                    to_analyze.append(article)
+                    to_analyze_hashes.append(article_hash)
+
+            log(f"[{project_id}] Gemini: analyzing {len(to_analyze)} articles "
+                f"({len(analyzed)} from cache), {len(articles_default)} with default")
+
+            if to_analyze:
+                # Progress callback for logging
+                def progress_log(current, total):
+                    if current == 1 or current == total or current % 5 == 0:
+                        log(f"[{project_id}] AI Progress: {current}/{total} articles")
+
+                from services.gemini import GeminiAnalyzer
+                gemini = GeminiAnalyzer()
+                fresh = gemini.batch_analyze_articles(
+                    to_analyze,
+                    project['brand'],
+                    progress_callback=progress_log
+                )
+
+                # Clean up Gemini analyzer aggressively
+                del gemini
+                gc.collect()
+
+                analyzed.extend(fresh)
+
+                # Persist the new analyses for future scrapes. The
+                # write is idempotent (re-analysis just recreates it),
+                # so skip the WAL fsync wait for this transaction
+                from psycopg2.extras import execute_values
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                execute_values(cursor, """
+                    INSERT INTO article_analysis_cache (hash, payload)
+                    VALUES %s
+                    ON CONFLICT (hash) DO NOTHING
+                """, [
+                    (article_hash, orjson.dumps({k: art.get(k) for k in ANALYSIS_FIELDS}).decode())
+                    for article_hash, art in zip(to_analyze_hashes, fresh)
+                ])
+                db.commit()
 
             log(f"[{project_id}] Gemini analysis completed for {len(analyzed)} articles")
 
-            # Add default analysis for remaining articles
+            # Add default analysis for remaining articles (in place)
             for a in articles_default:
-                analyzed.append({
-                    **a,
-                    'sentiment': 'neutral',
-                    'sentiment_score': 0.0,
-                    'topics': [],
-                    'entities': {},
-                    'summary': (a.get('snippet') or '')[:200],
-                    'relevance_score': 50.0
-                })
+                _default_analysis_inplace(a)
+            analyzed.extend(articles_default)
 
             if articles_default:
                 log(f"[{project_id}] Added {len(articles_default)} articles with default analysis")
 
-        # Save articles
-        new_articles = 0
-        for article in analyzed:
-            try:
-                cursor.execute("""
-                    INSERT INTO articles (
-                        project_id, url, title, source, published_at,
-                        snippet, summary, sentiment, sentiment_score,
-                        topics, entities, relevance_score, query_source
-                    ) VALUES (
-                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                    )
-                    ON CONFLICT (url) DO NOTHING
-                """, (
-                    project_id,
-                    article['url'],
-                    article.get('title'),
-                    article.get('source'),
-                    article.get('published_at'),
-                    article.get('snippet'),
-                    article.get('summary'),
-                    article.get('sentiment'),
-                    article.get('sentiment_score'),
-                    json.dumps(article.get('topics', [])),
-                    json.dumps(article.get('entities', {})),
-                    article.get('relevance_score'),
-                    article.get('query_source')
-                ))
-
-                if cursor.rowcount > 0:
-                    new_articles += 1
-
-            except Exception as e:
-                log(f"[{project_id}] Error saving article: {e}", 'error')
-                continue
+        # Save articles: one multi-VALUES statement instead of a
+        # round-trip per row; RETURNING counts the rows that survived
+        # the ON CONFLICT dedup
+        from psycopg2.extras import execute_values
+
+        records = [
+            (
+                project_id,
+                article['url'],
+                article.get('title'),
+                article.get('source'),
+                article.get('published_at'),
+                article.get('snippet'),
+                article.get('summary'),
+                article.get('sentiment'),
+                article.get('sentiment_score'),
+                orjson.dumps(article.get('topics', [])).decode(),
+                orjson.dumps(article.get('entities', {})).decode(),
+                article.get('relevance_score'),
+                article.get('query_source')
+            )
+            for article in analyzed
+        ]
+
+        # The batch is idempotent - a lost commit is recreated by the
+        # next scrape and ON CONFLICT absorbs it - so this transaction
+        # alone skips the WAL fsync wait; the job/schedule bookkeeping
+        # below commits with full durability as usual
+        cursor.execute("SET LOCAL synchronous_commit = off")
+        inserted = execute_values(cursor, """
+            INSERT INTO articles (
+                project_id, url, title, source, published_at,
+                snippet, summary, sentiment, sentiment_score,
+                topics, entities, relevance_score, query_source
+            ) VALUES %s
+            ON CONFLICT (url) DO NOTHING
+            RETURNING 1
+        """, records, page_size=500, fetch=True)
+        new_articles = len(inserted)
 
         db.commit()
         log(f"[{project_id}] Saved {new_articles} NEW articles (duplicates skipped)")
 
-        # Log API usage
-        cursor.execute("""
-            INSERT INTO api_logs (
-                project_id, api_name, endpoint, status_code, cost_usd
-            ) VALUES (%s, 'dataforseo', 'news', 200, %s)
-        """, (project_id, scrape_result['cost_usd']))
-
-        # Update job
-        cursor.execute("""
-            UPDATE scraping_jobs
-            SET status = 'completed',
-                completed_at = NOW(),
-                articles_found = %s,
-                new_articles = %s,
-                api_calls = %s
-            WHERE id = %s
-        """, (len(articles), new_articles, scrape_result['api_calls'], job_id))
-
-        # Update schedule
+        # Close out the run in one statement: API usage log, job
+        # completion and schedule bump ride a single round trip via
+        # data-modifying CTEs (independent writes, so ordering between
+        # them does not matter)
         cursor.execute("""
+            WITH api_log AS (
+                INSERT INTO api_logs (
+                    project_id, api_name, endpoint, status_code, cost_usd
+                ) VALUES (%s, 'dataforseo', 'news', 200, %s)
+            ),
+            job AS (
+                UPDATE scraping_jobs
+                SET status = 'completed',
+                    completed_at = NOW(),
+                    articles_found = %s,
+                    new_articles = %s,
+                    api_calls = %s
+                WHERE id = %s
+            )
             UPDATE schedules
             SET last_run = NOW(),
                 next_run = NOW() + INTERVAL '6 hours'
             WHERE project_id = %s
-        """, (project_id,))
+        """, (
+            project_id, scrape_result['cost_usd'],
+            len(articles), new_articles, scrape_result['api_calls'], job_id,
+            project_id
+        ))
 
         db.commit()
 
@@ -358,19 +478,19 @@ def scrape_project(self, project_id: int):
         if cursor:
             cursor.close()
         if db:
-            db.close()
+            get_pool().putconn(db)
 
 
-@celery_app.task(name='worker.scrape_all_active_projects')
+@celery_app.task(name='worker.scrape_all_active_projects', ignore_result=True)
 def scrape_all_active_projects():
     """
     Scheduled task: scrape all active projects
     """
     log("=== SCHEDULED SCRAPE START === Scraping all active projects")
 
-    from utils.db import get_db_connection
+    from utils.db import checkout_connection, get_pool
 
-    db = get_db_connection()
+    db = checkout_connection()
     cursor = db.cursor()
 
     try:
@@ -381,11 +501,15 @@ def scrape_all_active_projects():
         projects = cursor.fetchall()
         log(f"Found {len(projects)} active projects to scrape")
 
+        # One batched publish to the broker instead of a round-trip
+        # per project
+        if projects:
+            group(
+                scrape_project.s(project['id']) for project in projects
+            ).apply_async()
+
         for project in projects:
-            project_id = project['id']
-            name = project['name']
-            scrape_project.delay(project_id)
-            log(f"Queued: {name} (ID: {project_id})")
+            log(f"Queued: {project['name']} (ID: {project['id']})")
 
         log(f"=== SCHEDULED SCRAPE QUEUED === {len(projects)} projects")
 
@@ -397,10 +521,10 @@ def scrape_all_active_projects():
 
     finally:
         cursor.close()
-        db.close()
+        get_pool().putconn(db)
 
 
-@celery_app.task(name='worker.cleanup_stuck_jobs')
+@celery_app.task(name='worker.cleanup_stuck_jobs', ignore_result=True)
 def cleanup_stuck_jobs(hours_old: int = 2):
     """
     Clean up jobs that have been stuck in 'running' state for too long.
@@ -408,9 +532,9 @@ def cleanup_stuck_jobs(hours_old: int = 2):
     """
     log(f"=== CLEANUP START === Looking for jobs stuck > {hours_old} hours")
 
-    from utils.db import get_db_connection
+    from utils.db import checkout_connection, get_pool
 
-    db = get_db_connection()
+    db = checkout_connection()
     cursor = db.cursor()
 
     try:
@@ -450,7 +574,192 @@ def cleanup_stuck_jobs(hours_old: int = 2):
 
     finally:
         cursor.close()
-        db.close()
+        get_pool().putconn(db)
+
+
+# Lazy per-process singletons: the Gemini SDK client, the DataForSEO
+# HTTP session and the PDF exporter's style sheets are built once per
+# worker process instead of once per task invocation. scrape_project
+# keeps its own short-lived analyzer on purpose - it frees it
+# aggressively for the 512MB Railway workers.
+_gemini_analyzer = None
+_pdf_exporter = None
+_dataforseo_client = None
+
+
+def get_gemini():
+    global _gemini_analyzer
+    if _gemini_analyzer is None:
+        from services.gemini import GeminiAnalyzer
+        _gemini_analyzer = GeminiAnalyzer()
+    return _gemini_analyzer
+
+
+def get_pdf_exporter():
+    global _pdf_exporter
+    if _pdf_exporter is None:
+        from services.pdf_export import PDFExporter
+        _pdf_exporter = PDFExporter()
+    return _pdf_exporter
+
+
+def get_dataforseo():
+    global _dataforseo_client
+    if _dataforseo_client is None:
+        from services.dataforseo import DataForSEOClient
+        _dataforseo_client = DataForSEOClient()
+    return _dataforseo_client
+
+
+# Suggestions for the same brand/industry/market rarely change; keep
+# them for a day so retries and re-typed forms skip the Gemini call
+SUGGEST_CACHE_TTL = 24 * 3600
+
+# A manual re-scrape minutes after the scheduled one re-pays the same
+# DataForSEO query (~$0.10); serve identical searches from Redis for an
+# hour instead. Cache hits report zero api_calls/cost.
+SEARCH_CACHE_TTL = 3600
+
+
+def _search_news_cached(client, keywords, market, days_back, max_results):
+    """search_news with a Redis read-through cache on the parameters"""
+    cache_key = "search_news:" + "|".join(
+        (",".join(sorted(keywords)), market, str(days_back), str(max_results))
+    )
+
+    cache = None
+    try:
+        import redis
+        cache = redis.Redis.from_url(REDIS_URL)
+        cached = cache.get(cache_key)
+        if cached:
+            result = json.loads(cached)
+            result['api_calls'] = 0
+            result['cost_usd'] = 0
+            return result
+    except Exception as e:
+        log(f"Search cache unavailable (non-fatal): {e}", 'warning')
+
+    result = client.search_news(
+        keywords=keywords,
+        market=market,
+        days_back=days_back,
+        max_results=max_results
+    )
+
+    if cache is not None and result.get('success'):
+        try:
+            cache.set(cache_key, json.dumps(result), ex=SEARCH_CACHE_TTL)
+        except Exception as e:
+            log(f"Search cache write failed (non-fatal): {e}", 'warning')
+
+    return result
+
+
+@celery_app.task(name='worker.suggest_ai')
+def suggest_ai(brand: str, industry: str, market: str):
+    """
+    Generate AI competitor/keyword suggestions in the worker.
+
+    Runs the seconds-long Gemini call off the Streamlit thread; the
+    frontend polls the task result instead of blocking on the LLM.
+    Results are cached in Redis by normalized (brand, industry, market)
+    so repeated submissions don't re-pay the LLM round-trip.
+    """
+    log(f"=== SUGGEST START === Brand: {brand} | Industry: {industry} | Market: {market}")
+
+    cache_key = "suggest_ai:" + "|".join(
+        part.strip().lower() for part in (brand, industry, market)
+    )
+
+    cache = None
+    try:
+        import redis
+        cache = redis.Redis.from_url(REDIS_URL)
+        cached = cache.get(cache_key)
+        if cached:
+            log(f"=== SUGGEST CACHE HIT === Brand: {brand}")
+            return json.loads(cached)
+    except Exception as e:
+        log(f"Suggestion cache unavailable (non-fatal): {e}", 'warning')
+
+    try:
+        suggestions = get_gemini().suggest_competitors_keywords(brand, industry, market)
+        log(f"=== SUGGEST COMPLETE === Brand: {brand}")
+
+        if cache is not None:
+            try:
+                cache.set(cache_key, json.dumps(suggestions), ex=SUGGEST_CACHE_TTL)
+            except Exception as e:
+                log(f"Suggestion cache write failed (non-fatal): {e}", 'warning')
+
+        return suggestions
+
+    except Exception as e:
+        log(f"Suggestion error for {brand}: {e}", 'error')
+        return {'competitors': [], 'keywords': [], 'portals': [], 'error': str(e)}
+
+
+@celery_app.task(name='worker.export_pdf')
+def export_pdf(project_id: int, filter_days: int = 30, filter_sentiment=None, filter_source=None):
+    """
+    Render the PDF report in the worker instead of the Streamlit process.
+
+    Returns the PDF base64-encoded through the Redis result backend;
+    the frontend polls the task and offers the bytes for download.
+    """
+    log(f"=== PDF EXPORT START === Project ID: {project_id}, days: {filter_days}")
+
+    import base64
+    from utils.db import checkout_connection, get_pool
+
+    db = checkout_connection()
+    cursor = db.cursor()
+
+    try:
+        cursor.execute("SELECT * FROM projects WHERE id = %s", (project_id,))
+        project = cursor.fetchone()
+        if not project:
+            raise ValueError(f"Project {project_id} not found")
+
+        query = """
+            SELECT id, title, source, published_at, sentiment,
+                   sentiment_score, relevance_score, url, summary
+            FROM articles WHERE project_id = %s
+            AND scraped_at >= NOW() - make_interval(days => %s)
+        """
+        params = [project_id, filter_days]
+
+        if filter_sentiment:
+            placeholders = ','.join(['%s'] * len(filter_sentiment))
+            query += f" AND sentiment IN ({placeholders})"
+            params.extend(filter_sentiment)
+
+        if filter_source:
+            query += " AND source ILIKE %s"
+            params.append(f"%{filter_source}%")
+
+        query += " ORDER BY published_at DESC NULLS LAST LIMIT 100"
+
+        cursor.execute(query, params)
+        articles = cursor.fetchall()
+
+        pdf_bytes = get_pdf_exporter().generate_report(project, articles, filter_days)
+        log(f"=== PDF EXPORT COMPLETE === Project {project_id}: {len(pdf_bytes)} bytes")
+
+        return {
+            'success': True,
+            'pdf_b64': base64.b64encode(pdf_bytes).decode('ascii'),
+            'article_count': len(articles)
+        }
+
+    except Exception as e:
+        log(f"PDF export error for project {project_id}: {e}", 'error')
+        return {'success': False, 'error': str(e)}
+
+    finally:
+        cursor.close()
+        get_pool().putconn(db)
 
 
 @celery_app.task(name='worker.test_task')